@@ -25,6 +25,11 @@ class Settings:
     # Spotify API credentials (get from https://developer.spotify.com/dashboard)
     SPOTIFY_CLIENT_ID: str = os.getenv("SPOTIFY_CLIENT_ID", "")
     SPOTIFY_CLIENT_SECRET: str = os.getenv("SPOTIFY_CLIENT_SECRET", "")
+    # Optional SQLite file that keeps Spotify API responses across restarts
+    # and shares them between workers (empty = in-memory cache only)
+    SPOTIFY_CACHE_PATH: str = os.getenv("SPOTIFY_CACHE_PATH", "")
+    # Spotify calls allowed per rolling minute, per process (0 = no proactive limit)
+    SPOTIFY_MAX_RPM: int = int(os.getenv("SPOTIFY_MAX_RPM", "0"))
 
     # Supabase (for auth)
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
@@ -12,6 +12,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.database import Base, engine, async_session_maker
+from app.services.spotify import (
+    close_disk_cache as close_spotify_disk_cache,
+    purge_expired as purge_spotify_cache,
+    purge_expired_disk as purge_spotify_disk_cache,
+    spotify_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -245,16 +251,19 @@ async def lifespan(app: FastAPI):
     scanner_task = asyncio.create_task(_weekly_spotify_scanner())
     backfill_task = asyncio.create_task(_backfill_label_ids())
     alerts_task = asyncio.create_task(_admin_alerts_scanner())
+    cache_task = asyncio.create_task(_spotify_cache_sweeper())
 
     yield
 
     # Cleanup on shutdown
-    for task in (scanner_task, backfill_task, alerts_task):
+    for task in (scanner_task, backfill_task, alerts_task, cache_task):
         task.cancel()
         try:
             await task
         except asyncio.CancelledError:
             pass
+    spotify_service.close()
+    await close_spotify_disk_cache()
     await engine.dispose()
 
 
@@ -358,6 +367,25 @@ async def _admin_alerts_scanner():
         await asyncio.sleep(INTERVAL_SECONDS)
 
 
+async def _spotify_cache_sweeper():
+    """
+    Background task that drops expired Spotify cache entries every 10 minutes,
+    so lookups that are never repeated don't hold memory (or disk, when
+    SPOTIFY_CACHE_PATH is set) until evicted.
+    """
+    INTERVAL_SECONDS = 10 * 60
+
+    while True:
+        await asyncio.sleep(INTERVAL_SECONDS)
+        try:
+            removed = purge_spotify_cache() + await purge_spotify_disk_cache()
+        except Exception as exc:
+            logger.error(f"Spotify cache sweep error: {exc}", exc_info=True)
+            continue
+        if removed:
+            logger.debug(f"Spotify cache sweep removed {removed} expired entries")
+
+
 app = FastAPI(
     title="Royalties MVP",
     description="Music royalties calculation tool for independent labels",
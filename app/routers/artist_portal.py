@@ -737,18 +737,10 @@ async def _resolve_release_artwork(db: AsyncSession, upcs: List[str]) -> dict:
 
     # 3. On-demand Spotify backfill (bounded, concurrent, best-effort) — caches for everyone
     if missing and settings.SPOTIFY_CLIENT_ID and settings.SPOTIFY_CLIENT_SECRET:
-        import asyncio
         from app.services.spotify import spotify_service
 
         to_fetch = missing[:24]
-
-        async def _lookup(u: str):
-            try:
-                return u, await spotify_service.search_album_by_upc(u)
-            except Exception:
-                return u, None
-
-        results = await asyncio.gather(*[_lookup(u) for u in to_fetch])
+        results = (await spotify_service.search_albums_by_upcs(to_fetch)).items()
 
         touched = False
         existing_rows = {
@@ -807,18 +799,10 @@ async def _resolve_track_artwork(db: AsyncSession, pairs: List[tuple]) -> dict:
 
     # 2. Spotify backfill by ISRC (bounded, concurrent, best-effort) — caches for everyone
     if missing and settings.SPOTIFY_CLIENT_ID and settings.SPOTIFY_CLIENT_SECRET:
-        import asyncio
         from app.services.spotify import spotify_service
 
         to_fetch = missing[:24]
-
-        async def _lookup(i: str):
-            try:
-                return i, await spotify_service.search_track_by_isrc(i)
-            except Exception:
-                return i, None
-
-        results = await asyncio.gather(*[_lookup(i) for i in to_fetch])
+        results = (await spotify_service.search_tracks_by_isrcs(to_fetch)).items()
         existing = {
             r.isrc: r for r in (await db.execute(
                 select(TrackArtwork).where(TrackArtwork.isrc.in_([i for i, _ in results]))
@@ -2109,12 +2093,14 @@ async def get_notifications(
     result = await db.execute(query)
     notifications = result.scalars().all()
 
-    # Get artist names
-    artist_ids = [n.artist_id for n in notifications if n.artist_id]
-    artists_result = await db.execute(
-        select(Artist).where(Artist.id.in_(artist_ids))
-    )
-    artists_map = {a.id: a.name for a in artists_result.scalars().all()}
+    # Get artist names (only the two columns needed, once per distinct artist)
+    artist_ids = {n.artist_id for n in notifications if n.artist_id}
+    artists_map = {}
+    if artist_ids:
+        artists_result = await db.execute(
+            select(Artist.id, Artist.name).where(Artist.id.in_(artist_ids))
+        )
+        artists_map = {row.id: row.name for row in artists_result.all()}
 
     return [
         {
@@ -0,0 +1,34 @@
+"""
+Shared text helpers for the CSV parsers.
+"""
+
+import io
+from typing import Optional, TextIO, Union
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _decode(content: Union[str, bytes]) -> str:
+    """Decode CSV bytes as UTF-8 (leading BOM dropped), falling back to latin-1."""
+    if isinstance(content, bytes):
+        if content[:3] == _UTF8_BOM:
+            content = content[3:]
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            return content.decode("latin-1")
+    return content
+
+
+def _open_text(content: Union[str, bytes], newline: Optional[str] = "") -> TextIO:
+    """Open CSV content as a text stream.
+
+    ASCII bytes are decoded lazily as the reader consumes them; other bytes are
+    decoded once, up front, as _decode does. The default newline="" is what
+    csv.reader expects; pass None for universal newlines.
+    """
+    if isinstance(content, bytes):
+        if content.isascii():
+            return io.TextIOWrapper(io.BytesIO(content), encoding="ascii", newline=newline)
+        content = _decode(content)
+    return io.StringIO(content, newline=newline)
@@ -0,0 +1,14 @@
+"""
+Types shared by the CSV parsers.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class ParseError:
+    """Represents a parsing error for a specific row."""
+    row_number: int
+    error: str
+    raw_data: Optional[Dict] = None
@@ -12,13 +12,17 @@ Believe FR CSV format:
 """
 
 import csv
-import io
+import re
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Iterator, List, Optional, Union
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
+from app.services.parsers._text import _open_text
+from app.services.parsers._types import ParseError
 
-@dataclass
+
+@dataclass(slots=True)
 class BelieveFRRow:
     """Raw parsed row from Believe FR CSV."""
     row_number: int
@@ -44,15 +48,13 @@ class BelieveFRRow:
     amount: Decimal  # Final amount after rate
 
 
-@dataclass
-class ParseError:
-    """Represents a parsing error for a specific row."""
-    row_number: int
-    error: str
-    raw_data: Optional[Dict] = None
+# BelieveFRRow values as a plain tuple, in field order (see parse_iter_tuples)
+BelieveFRTuple = Tuple[Any, ...]
+
+T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class BelieveFRParseResult:
     """Result of parsing a Believe FR CSV."""
     rows: List[BelieveFRRow] = field(default_factory=list)
@@ -60,7 +62,7 @@ class BelieveFRParseResult:
     total_rows: int = 0
 
 
-# Column name mappings
+# Column name mappings (BelieveFRParser._parse_row unpacks fields in this order)
 COLUMN_MAPPINGS = {
     "type": ["type"],
     "exploitation_type": ["exploitation type"],
@@ -88,22 +90,28 @@ COLUMN_MAPPINGS = {
 }
 
 
-def _find_column_index(headers: List[str], field_name: str) -> Optional[int]:
-    """Find column index by trying multiple possible names."""
-    possible_names = COLUMN_MAPPINGS.get(field_name, [field_name])
-    headers_lower = [h.lower().strip() for h in headers]
+def _build_header_map(headers: List[str]) -> Dict[str, int]:
+    """Map each lowercased header to its first column index."""
+    header_map: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        header_map.setdefault(header.lower().strip(), index)
+    return header_map
+
 
-    for name in possible_names:
-        if name.lower() in headers_lower:
-            return headers_lower.index(name.lower())
+def _find_column_index(header_map: Dict[str, int], field_name: str) -> Optional[int]:
+    """Find column index by trying multiple possible names."""
+    for name in COLUMN_MAPPINGS.get(field_name, [field_name]):
+        index = header_map.get(name)
+        if index is not None:
+            return index
     return None
 
 
-def _get_value(row: List[str], index: Optional[int], default: str = "") -> str:
-    """Safely get value from row by index."""
-    if index is None or index >= len(row):
-        return default
-    return row[index].strip()
+# Currency symbols and the no-break/thin spaces French exports use as
+# thousands separators (a regular space inside a number is still an error)
+_DECIMAL_NOISE = re.compile("[€$£\u00a0\u202f\u2009]")
+
+_HUNDRED = Decimal("100")
 
 
 def _parse_decimal_french(value: str) -> Decimal:
@@ -113,41 +121,40 @@ def _parse_decimal_french(value: str) -> Decimal:
     if not value:
         return Decimal("0")
 
-    # Remove currency symbols and whitespace
-    cleaned = value.replace("€", "").replace("$", "").replace("£", "").strip()
+    cleaned = _DECIMAL_NOISE.sub("", value).strip()
 
     # Handle percentage format (100,00% -> 1.0)
-    if cleaned.endswith("%"):
-        cleaned = cleaned[:-1].strip()
-        # Replace comma with period for decimal
-        if "," in cleaned and "." not in cleaned:
-            cleaned = cleaned.replace(",", ".")
-        try:
-            return Decimal(cleaned) / Decimal("100")
-        except InvalidOperation:
-            return Decimal("0")
+    percent = cleaned.endswith("%")
+    if percent:
+        cleaned = cleaned[:-1].rstrip()
 
     # Handle negative in parentheses: (123,45) -> -123.45
     if cleaned.startswith("(") and cleaned.endswith(")"):
         cleaned = "-" + cleaned[1:-1]
 
     # Replace French decimal separator (comma) with period
-    if "," in cleaned and "." not in cleaned:
+    if "," in cleaned:
+        if "." in cleaned:
+            # Format: 1.234,56 (thousands separator is period, decimal is comma)
+            cleaned = cleaned.replace(".", "")
         cleaned = cleaned.replace(",", ".")
-    elif "," in cleaned and "." in cleaned:
-        # Format: 1.234,56 (thousands separator is period, decimal is comma)
-        cleaned = cleaned.replace(".", "").replace(",", ".")
 
     try:
-        return Decimal(cleaned)
+        number = Decimal(cleaned)
     except InvalidOperation:
+        if percent:
+            return Decimal("0")
         raise ValueError(f"Cannot parse decimal: {value}")
+    return number / _HUNDRED if percent else number
 
 
 def _parse_int(value: str) -> int:
     """Parse integer value."""
     if not value:
         return 0
+    # Fast path for plain integers, by far the most common unit counts
+    if value.isdecimal() or (value[0] == "-" and value[1:].isdecimal()):
+        return int(value)
     try:
         # Handle decimal units (e.g., "1,0" -> 1)
         cleaned = value.replace(",", ".").replace(" ", "")
@@ -161,11 +168,15 @@ class BelieveFRParser:
 
     def __init__(self):
         self._column_indices: Dict[str, Optional[int]] = {}
+        self._row_width = 0
+        self._getter: Optional[itemgetter] = None
+        self._strings: Dict[str, str] = {}
 
     def _detect_columns(self, headers: List[str]) -> None:
         """Detect column indices from headers."""
+        header_map = _build_header_map(headers)
         for field_name in COLUMN_MAPPINGS:
-            self._column_indices[field_name] = _find_column_index(headers, field_name)
+            self._column_indices[field_name] = _find_column_index(header_map, field_name)
 
         # Validate required columns
         required = ["track_artist", "amount"]
@@ -173,65 +184,90 @@ class BelieveFRParser:
         if missing:
             raise ValueError(f"Missing required columns: {missing}. Available columns: {headers}")
 
-    def _parse_row(self, row: List[str], row_number: int) -> Optional[BelieveFRRow]:
-        """Parse a single CSV row into a BelieveFRRow. Returns None for payment/summary rows."""
+        # Absent columns point at a trailing blank slot so that every field can be
+        # fetched with a single itemgetter call (in COLUMN_MAPPINGS order).
+        blank = len(headers)
+        self._row_width = blank + 1
+        self._getter = itemgetter(*(
+            blank if index is None else index
+            for index in self._column_indices.values()
+        ))
+        self._strings = {}
+
+    def _parse_fields(self, row: List[str], row_number: int) -> Optional[BelieveFRTuple]:
+        """Parse a single CSV row into a tuple in BelieveFRRow field order.
+
+        Returns None for payment/summary rows.
+        """
+        blank = self._row_width - 1
+        if len(row) == blank:
+            row = row + [""]
+        else:
+            # Short rows are padded; cells past the header are dropped so that they
+            # can never be read as an absent column
+            row = row[:blank] + [""] * (self._row_width - min(len(row), blank))
+
+        (
+            row_type, exploitation_type, reporting_date, operation_date, shop, country,
+            upc, product_artist, product_title, isrc, track_artist, track_title,
+            track_version, _sales, _returns, net_sales_str, currency, unit_price_str,
+            income_str, net_income_str, share_str, rate_str, amount_str,
+        ) = [value.strip() for value in self._getter(row)]
+
         # Skip payment/summary rows
-        row_type = _get_value(row, self._column_indices.get("type"))
         if row_type.lower() == "payment":
             return None
 
-        track_artist = _get_value(row, self._column_indices.get("track_artist"))
+        # Low-cardinality columns share one string object per distinct value
+        intern = self._strings.setdefault
+        exploitation_type = intern(exploitation_type, exploitation_type)
+        shop = intern(shop, shop)
+        country = intern(country, country)
+        currency = intern(currency, currency)
+
         if not track_artist:
             # Try product_artist as fallback
-            track_artist = _get_value(row, self._column_indices.get("product_artist"))
+            track_artist = product_artist
         if not track_artist:
             raise ValueError("Artist name is required")
 
-        amount_str = _get_value(row, self._column_indices.get("amount"), "0")
         amount = _parse_decimal_french(amount_str)
-
-        income_str = _get_value(row, self._column_indices.get("income"), "0")
         income = _parse_decimal_french(income_str)
-
-        net_income_str = _get_value(row, self._column_indices.get("net_income"), "0")
         net_income = _parse_decimal_french(net_income_str)
-
-        unit_price_str = _get_value(row, self._column_indices.get("unit_price"), "0")
         unit_price = _parse_decimal_french(unit_price_str)
-
-        net_sales_str = _get_value(row, self._column_indices.get("net_sales"), "0")
         net_sales = _parse_int(net_sales_str)
-
-        share_str = _get_value(row, self._column_indices.get("share"))
         share = _parse_decimal_french(share_str) if share_str else None
-
-        rate_str = _get_value(row, self._column_indices.get("rate"))
         rate = _parse_decimal_french(rate_str) if rate_str else None
 
-        return BelieveFRRow(
-            row_number=row_number,
-            exploitation_type=_get_value(row, self._column_indices.get("exploitation_type")),
-            reporting_date=_get_value(row, self._column_indices.get("reporting_date")),
-            operation_date=_get_value(row, self._column_indices.get("operation_date")),
-            shop=_get_value(row, self._column_indices.get("shop")) or None,
-            country=_get_value(row, self._column_indices.get("country")) or None,
-            upc=_get_value(row, self._column_indices.get("upc")) or None,
-            product_artist=_get_value(row, self._column_indices.get("product_artist")),
-            product_title=_get_value(row, self._column_indices.get("product_title")),
-            isrc=_get_value(row, self._column_indices.get("isrc")) or None,
-            track_artist=track_artist,
-            track_title=_get_value(row, self._column_indices.get("track_title")),
-            track_version=_get_value(row, self._column_indices.get("track_version")) or None,
-            net_sales=net_sales,
-            currency=_get_value(row, self._column_indices.get("currency"), "EUR"),
-            unit_price=unit_price,
-            income=income,
-            net_income=net_income,
-            share=share,
-            rate=rate,
-            amount=amount,
+        return (
+            row_number,
+            exploitation_type,
+            reporting_date,
+            operation_date,
+            shop or None,
+            country or None,
+            upc or None,
+            product_artist,
+            product_title,
+            isrc or None,
+            track_artist,
+            track_title,
+            track_version or None,
+            net_sales,
+            currency or "EUR",
+            unit_price,
+            income,
+            net_income,
+            share,
+            rate,
+            amount,
         )
 
+    def _parse_row(self, row: List[str], row_number: int) -> Optional[BelieveFRRow]:
+        """Parse a single CSV row into a BelieveFRRow. Returns None for payment/summary rows."""
+        fields = self._parse_fields(row, row_number)
+        return None if fields is None else BelieveFRRow(*fields)
+
     def parse(self, content: Union[str, bytes]) -> BelieveFRParseResult:
         """
         Parse Believe FR CSV content.
@@ -242,20 +278,10 @@ class BelieveFRParser:
         Returns:
             BelieveFRParseResult with parsed rows and errors
         """
-        if isinstance(content, bytes):
-            # Try UTF-8 with BOM first, then latin-1 as fallback
-            try:
-                content = content.decode("utf-8-sig")
-            except UnicodeDecodeError:
-                try:
-                    content = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    content = content.decode("latin-1")
-
         result = BelieveFRParseResult()
 
         # Believe FR uses semicolon as delimiter
-        reader = csv.reader(io.StringIO(content), delimiter=";")
+        reader = csv.reader(_open_text(content), delimiter=";")
 
         try:
             headers = next(reader)
@@ -275,24 +301,33 @@ class BelieveFRParser:
             ))
             return result
 
-        for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
-            result.total_rows += 1
+        # Bulk path: bind the per-row callables once and count rows from the
+        # enumerate cursor instead of touching result attributes on every row
+        parse_fields = self._parse_fields
+        append_row = result.rows.append
+        append_error = result.errors.append
 
-            # Skip empty rows
-            if not row or all(cell.strip() == "" for cell in row):
+        row_number = 1
+        for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
+            if not row:
                 continue
 
             try:
-                parsed_row = self._parse_row(row, row_number)
-                if parsed_row is not None:  # Skip payment rows
-                    result.rows.append(parsed_row)
+                fields = parse_fields(row, row_number)
+                if fields is not None:  # Skip payment rows
+                    append_row(BelieveFRRow(*fields))
             except (ValueError, IndexError) as e:
-                result.errors.append(ParseError(
+                # Blank rows (e.g. trailing separators) never parse, so they are
+                # only told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
+                append_error(ParseError(
                     row_number=row_number,
                     error=str(e),
-                    raw_data=dict(zip(headers[:len(row)], row)) if row else None,
+                    raw_data=dict(zip(headers, row)) if row else None,
                 ))
 
+        result.total_rows = row_number - 1
         return result
 
     def parse_iter(self, content: Union[str, bytes]) -> Iterator[Union[BelieveFRRow, ParseError]]:
@@ -302,16 +337,28 @@ class BelieveFRParser:
         Yields:
             BelieveFRRow or ParseError for each row
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")
-            except UnicodeDecodeError:
-                try:
-                    content = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    content = content.decode("latin-1")
+        return self._iter_rows(content, self._parse_row)
+
+    def parse_iter_tuples(self, content: Union[str, bytes]) -> Iterator[Union[BelieveFRTuple, ParseError]]:
+        """
+        Parse Believe FR CSV content as an iterator of plain tuples.
+
+        For streaming consumers that bind values straight into another sink
+        (e.g. executemany) and do not need BelieveFRRow objects.
+
+        Yields:
+            Tuple in BelieveFRRow field order (row_number, exploitation_type, ...,
+            rate, amount) or ParseError for each row
+        """
+        return self._iter_rows(content, self._parse_fields)
 
-        reader = csv.reader(io.StringIO(content), delimiter=";")
+    def _iter_rows(
+        self,
+        content: Union[str, bytes],
+        parse_row: Callable[[List[str], int], Optional[T]],
+    ) -> Iterator[Union[T, ParseError]]:
+        """Drive parse_row over each CSV row, yielding results and row errors."""
+        reader = csv.reader(_open_text(content), delimiter=";")
 
         try:
             headers = next(reader)
@@ -326,16 +373,20 @@ class BelieveFRParser:
             return
 
         for row_number, row in enumerate(reader, start=2):
-            if not row or all(cell.strip() == "" for cell in row):
+            if not row:
                 continue
 
             try:
-                parsed_row = self._parse_row(row, row_number)
+                parsed_row = parse_row(row, row_number)
                 if parsed_row is not None:
                     yield parsed_row
             except (ValueError, IndexError) as e:
+                # Blank rows (e.g. trailing separators) never parse, so they are
+                # only told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
                 yield ParseError(
                     row_number=row_number,
                     error=str(e),
-                    raw_data=dict(zip(headers[:len(row)], row)) if row else None,
+                    raw_data=dict(zip(headers, row)) if row else None,
                 )
@@ -37,13 +37,17 @@ Groover CSV columns (new format, 2025+):
 """
 
 import csv
-import io
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Iterator, List, Optional, Union
 
+from app.services.parsers._text import _open_text
+from app.services.parsers._types import ParseError
 
-@dataclass
+
+@dataclass(slots=True)
 class GrooverRow:
     """Raw parsed row from Groover CSV."""
     row_number: int
@@ -60,15 +64,7 @@ class GrooverRow:
     answer_date: Optional[str]
 
 
-@dataclass
-class ParseError:
-    """Represents a parsing error for a specific row."""
-    row_number: int
-    error: str
-    raw_data: Optional[Dict] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class GrooverParseResult:
     """Result of parsing a Groover CSV."""
     rows: List[GrooverRow] = field(default_factory=list)
@@ -77,6 +73,7 @@ class GrooverParseResult:
 
 
 # Column name mappings - tolerant to variations across old and new Groover export formats
+# (GrooverParser._parse_row unpacks fields in this order)
 COLUMN_MAPPINGS = {
     "submission_id": ["submission id", "submission_id", "id", "sub id"],
     "band": ["band", "artist", "artist name", "band name"],
@@ -93,24 +90,24 @@ COLUMN_MAPPINGS = {
 }
 
 
-def _find_column_index(headers: List[str], field_name: str) -> Optional[int]:
-    """Find column index by trying multiple possible names."""
-    possible_names = COLUMN_MAPPINGS.get(field_name, [field_name])
-    headers_lower = [h.lower().strip() for h in headers]
-
-    for name in possible_names:
-        if name.lower() in headers_lower:
-            return headers_lower.index(name.lower())
-    return None
+def _build_header_map(headers: List[str]) -> Dict[str, int]:
+    """Map each lowercased header to its first column index."""
+    header_map: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        header_map.setdefault(header.lower().strip(), index)
+    return header_map
 
 
-def _get_value(row: List[str], index: Optional[int], default: str = "") -> str:
-    """Safely get value from row by index."""
-    if index is None or index >= len(row):
-        return default
-    return row[index].strip()
+def _find_column_index(header_map: Dict[str, int], field_name: str) -> Optional[int]:
+    """Find column index by trying multiple possible names."""
+    for name in COLUMN_MAPPINGS.get(field_name, [field_name]):
+        index = header_map.get(name)
+        if index is not None:
+            return index
+    return None
 
 
+@lru_cache(maxsize=1024)
 def _normalize_type(type_str: str) -> Optional[str]:
     """Normalize Groover influencer type to standard values."""
     if not type_str:
@@ -134,43 +131,62 @@ def _normalize_type(type_str: str) -> Optional[str]:
     return type_lower.replace(" ", "-")
 
 
-def _parse_date(date_str: str) -> Optional[str]:
-    """Parse date string to ISO format.
+# Common date formats from Groover, tried in order
+_DATE_FORMATS = (
+    "%Y-%m-%d",           # 2026-01-27
+    "%m/%d/%Y",           # 01/27/2026
+    "%d/%m/%Y",           # 27/01/2026
+    "%Y/%m/%d",           # 2026/01/27
+    "%b %d, %Y",          # Jan 27, 2026
+    "%B %d, %Y",          # January 27, 2026
+    "%d %b %Y",           # 27 Jan 2026
+    "%d %B %Y",           # 27 January 2026
+    "%d.%m.%Y",           # 27.01.2026 (European)
+    "%Y.%m.%d",           # 2026.01.27
+)
+
+# Numeric formats are split and built with date() directly instead of going
+# through strptime: format -> (separator, positions of year, month and day)
+_NUMERIC_DATE_FORMATS = {
+    "%Y-%m-%d": ("-", (0, 1, 2)),
+    "%m/%d/%Y": ("/", (2, 0, 1)),
+    "%d/%m/%Y": ("/", (2, 1, 0)),
+    "%Y/%m/%d": ("/", (0, 1, 2)),
+    "%d.%m.%Y": (".", (2, 1, 0)),
+    "%Y.%m.%d": (".", (0, 1, 2)),
+}
+
 
-    Handles common date formats from Groover.
-    Returns ISO format string or None if parsing fails.
-    """
-    if not date_str:
+def _parse_numeric_date(date_str: str, separator: str, positions: tuple[int, int, int]) -> Optional[str]:
+    """Parse a numeric date such as 27/01/2026. Returns ISO format string or None."""
+    parts = date_str.split(separator)
+    if len(parts) != 3:
         return None
 
-    date_str = date_str.strip()
-    if not date_str:
+    y, m, d = positions
+    year, month, day = parts[y], parts[m], parts[d]
+    if not (
+        len(year) == 4 and 0 < len(month) < 3 and 0 < len(day) < 3
+        and year.isdecimal() and month.isdecimal() and day.isdecimal()
+    ):
+        return None
+
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
         return None
 
-    # Common formats to try
-    formats = [
-        "%Y-%m-%d",           # 2026-01-27
-        "%m/%d/%Y",           # 01/27/2026
-        "%d/%m/%Y",           # 27/01/2026
-        "%Y/%m/%d",           # 2026/01/27
-        "%b %d, %Y",          # Jan 27, 2026
-        "%B %d, %Y",          # January 27, 2026
-        "%d %b %Y",           # 27 Jan 2026
-        "%d %B %Y",           # 27 January 2026
-        "%d.%m.%Y",           # 27.01.2026 (European)
-        "%Y.%m.%d",           # 2026.01.27
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.date().isoformat()
-        except ValueError:
-            continue
 
-    # If all formats fail, return the original string
-    # (will be validated later in the API layer)
-    return date_str
+def _try_date_format(date_str: str, fmt: str) -> Optional[str]:
+    """Parse date string with a single format. Returns ISO format string or None."""
+    numeric = _NUMERIC_DATE_FORMATS.get(fmt)
+    if numeric is not None:
+        return _parse_numeric_date(date_str, *numeric)
+
+    try:
+        return datetime.strptime(date_str, fmt).date().isoformat()
+    except ValueError:
+        return None
 
 
 class GrooverParser:
@@ -178,11 +194,16 @@ class GrooverParser:
 
     def __init__(self):
         self._column_indices: Dict[str, Optional[int]] = {}
+        self._row_width = 0
+        self._getter: Optional[itemgetter] = None
+        self._date_cache: Dict[str, str] = {}
+        self._strings: Dict[str, str] = {}
 
     def _detect_columns(self, headers: List[str]) -> None:
         """Detect column indices from headers."""
+        header_map = _build_header_map(headers)
         for field_name in COLUMN_MAPPINGS:
-            self._column_indices[field_name] = _find_column_index(headers, field_name)
+            self._column_indices[field_name] = _find_column_index(header_map, field_name)
 
         # Validate required columns
         required = ["track", "influencer", "decisions"]
@@ -190,18 +211,71 @@ class GrooverParser:
         if missing:
             raise ValueError(f"Missing required columns: {missing}. Available columns: {headers}")
 
+        # Absent columns point at a trailing blank slot so that every field can be
+        # fetched with a single itemgetter call (in COLUMN_MAPPINGS order).
+        blank = len(headers)
+        self._row_width = blank + 1
+        self._getter = itemgetter(*(
+            blank if index is None else index
+            for index in self._column_indices.values()
+        ))
+        self._date_cache = {}
+        self._strings = {}
+
+    def _parse_date(self, date_str: str) -> Optional[str]:
+        """Parse date string to ISO format.
+
+        A submission history only holds a few hundred distinct dates, so each
+        distinct cell is converted once per file and then served from a cache.
+        Returns ISO format string or None if the string is empty.
+        """
+        if not date_str:
+            return None
+
+        parsed = self._date_cache.get(date_str)
+        if parsed is None:
+            parsed = self._date_cache[date_str] = self._convert_date(date_str)
+        return parsed
+
+    def _convert_date(self, date_str: str) -> str:
+        """Convert a non-empty date string to ISO format (first matching format wins)."""
+        for fmt in _DATE_FORMATS:
+            parsed = _try_date_format(date_str, fmt)
+            if parsed is not None:
+                return parsed
+
+        # If all formats fail, return the original string
+        # (will be validated later in the API layer)
+        return date_str
+
     def _parse_row(self, row: List[str], row_number: int) -> GrooverRow:
         """Parse a single CSV row into a GrooverRow."""
+        blank = self._row_width - 1
+        if len(row) == blank:
+            row = row + [""]
+        else:
+            # Short rows are padded; cells past the header are dropped so that they
+            # can never be read as an absent column
+            row = row[:blank] + [""] * (self._row_width - min(len(row), blank))
+
+        (
+            submission_id, band_name, track_title, track_link, influencer_name, type_raw,
+            decision, feedback, sharing_link, sent_date_raw, answer_date_raw,
+        ) = [value.strip() for value in self._getter(row)]
 
-        track_title = _get_value(row, self._column_indices.get("track"))
         if not track_title:
             raise ValueError("Missing track title")
 
-        influencer_name = _get_value(row, self._column_indices.get("influencer"))
         if not influencer_name:
             raise ValueError("Missing influencer name")
 
-        band_name = _get_value(row, self._column_indices.get("band"))
+        # Curators and their types repeat across submissions: share one string per value
+        intern = self._strings.setdefault
+        influencer_name = intern(influencer_name, influencer_name)
+        influencer_type = _normalize_type(type_raw)
+        if influencer_type is not None:
+            influencer_type = intern(influencer_type, influencer_type)
+
         if not band_name:
             # Try to extract from track title if it contains " - "
             if " - " in track_title:
@@ -211,30 +285,19 @@ class GrooverParser:
             else:
                 band_name = "Unknown Artist"
 
-        type_raw = _get_value(row, self._column_indices.get("type"))
-        influencer_type = _normalize_type(type_raw)
-
-        sent_date_raw = _get_value(row, self._column_indices.get("sent"))
-        sent_date = _parse_date(sent_date_raw)
-
-        answer_date_raw = _get_value(row, self._column_indices.get("answer_date"))
-        answer_date = _parse_date(answer_date_raw)
-
-        submission_id = _get_value(row, self._column_indices.get("submission_id")) or None
-
         return GrooverRow(
             row_number=row_number,
-            submission_id=submission_id,
+            submission_id=submission_id or None,
             band_name=band_name,
             track_title=track_title,
-            track_link=_get_value(row, self._column_indices.get("track_link")) or None,
+            track_link=track_link or None,
             influencer_name=influencer_name,
             influencer_type=influencer_type,
-            decision=_get_value(row, self._column_indices.get("decisions")) or None,
-            feedback=_get_value(row, self._column_indices.get("feedback")) or None,
-            sharing_link=_get_value(row, self._column_indices.get("sharing_link")) or None,
-            sent_date=sent_date,
-            answer_date=answer_date,
+            decision=decision or None,
+            feedback=feedback or None,
+            sharing_link=sharing_link or None,
+            sent_date=self._parse_date(sent_date_raw),
+            answer_date=self._parse_date(answer_date_raw),
         )
 
     def parse(self, content: Union[str, bytes]) -> GrooverParseResult:
@@ -247,16 +310,12 @@ class GrooverParser:
         Returns:
             GrooverParseResult with parsed rows and errors
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")  # Handle BOM
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
         result = GrooverParseResult()
+        stream = _open_text(content)
 
         # Detect delimiter (comma, semicolon, or tab)
-        sample = content[:2000] if len(content) > 2000 else content
+        sample = stream.read(2000)
+        stream.seek(0)
         sniffer = csv.Sniffer()
         try:
             delimiter = sniffer.sniff(sample).delimiter
@@ -265,7 +324,7 @@ class GrooverParser:
             delimiter = ','
 
         # Use csv.reader for robust parsing
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
+        reader = csv.reader(stream, delimiter=delimiter)
 
         try:
             headers = next(reader)
@@ -288,18 +347,21 @@ class GrooverParser:
         for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
             result.total_rows += 1
 
-            # Skip empty rows
-            if not row or all(cell.strip() == "" for cell in row):
+            if not row:
                 continue
 
             try:
                 parsed_row = self._parse_row(row, row_number)
                 result.rows.append(parsed_row)
             except (ValueError, IndexError) as e:
+                # Blank rows (e.g. trailing separators) never parse, so they are
+                # only told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
                 result.errors.append(ParseError(
                     row_number=row_number,
                     error=str(e),
-                    raw_data=dict(zip(headers[:len(row)], row)) if row else None,
+                    raw_data=dict(zip(headers, row)) if row else None,
                 ))
 
         return result
@@ -311,14 +373,11 @@ class GrooverParser:
         Yields:
             GrooverRow or ParseError for each row
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
+        stream = _open_text(content)
 
         # Detect delimiter (comma, semicolon, or tab)
-        sample = content[:2000] if len(content) > 2000 else content
+        sample = stream.read(2000)
+        stream.seek(0)
         sniffer = csv.Sniffer()
         try:
             delimiter = sniffer.sniff(sample).delimiter
@@ -326,7 +385,7 @@ class GrooverParser:
             # Default to comma if detection fails
             delimiter = ','
 
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
+        reader = csv.reader(stream, delimiter=delimiter)
 
         try:
             headers = next(reader)
@@ -341,14 +400,18 @@ class GrooverParser:
             return
 
         for row_number, row in enumerate(reader, start=2):
-            if not row or all(cell.strip() == "" for cell in row):
+            if not row:
                 continue
 
             try:
                 yield self._parse_row(row, row_number)
             except (ValueError, IndexError) as e:
+                # Blank rows (e.g. trailing separators) never parse, so they are
+                # only told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
                 yield ParseError(
                     row_number=row_number,
                     error=str(e),
-                    raw_data=dict(zip(headers[:len(row)], row)) if row else None,
+                    raw_data=dict(zip(headers, row)) if row else None,
                 )
@@ -19,13 +19,18 @@ The parser auto-detects the format from the CSV headers.
 import csv
 import io
 import re
-from collections import defaultdict
 from dataclasses import dataclass, field
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Iterator, List, Optional, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from app.services.parsers._text import _decode
+from app.services.parsers._types import ParseError
 
-@dataclass
+
+@dataclass(slots=True)
 class SquarespaceRow:
     """Raw parsed row from Squarespace CSV."""
     row_number: int
@@ -36,21 +41,13 @@ class SquarespaceRow:
     quantity: int
     net_amount: Decimal  # Lineitem price (excluding shipping & taxes)
     currency: str
-    date_from: Optional[str]
+    date_from: Optional[str]  # ISO date of "Paid at"
     sku: Optional[str] = None
     variant: Optional[str] = None  # Color, edition, etc.
     payment_method: Optional[str] = None
 
 
-@dataclass
-class ParseError:
-    """Represents a parsing error for a specific row."""
-    row_number: int
-    error: str
-    raw_data: Optional[Dict] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class SquarespaceProductRow:
     """Raw parsed row from Squarespace Products CSV export."""
     row_number: int
@@ -64,7 +61,7 @@ class SquarespaceProductRow:
     upc: Optional[str] = None  # GTIN column
 
 
-@dataclass
+@dataclass(slots=True)
 class SquarespaceParseResult:
     """Result of parsing a Squarespace CSV (orders or products format)."""
     rows: List[Union[SquarespaceRow, "SquarespaceProductRow"]] = field(default_factory=list)
@@ -72,18 +69,20 @@ class SquarespaceParseResult:
     total_rows: int = 0
 
 
+# Characters dropped from amounts: currency symbols and thousands separators
+_CCY_STRIP = str.maketrans('', '', '$€£¥,')
+
+
 def _parse_decimal(value: str) -> Decimal:
     """Parse decimal value, handling various formats."""
     if not value or value.strip() == "":
         return Decimal("0")
 
-    # Remove currency symbols and whitespace
-    cleaned = value.replace("$", "").replace("€", "").replace("£", "").replace("¥", "").strip()
+    # Remove currency symbols, thousands separators and whitespace
+    cleaned = value.translate(_CCY_STRIP).strip()
     # Handle negative in parentheses: (123.45) -> -123.45
     if cleaned.startswith("(") and cleaned.endswith(")"):
         cleaned = "-" + cleaned[1:-1]
-    # Remove thousands separators
-    cleaned = cleaned.replace(",", "")
 
     try:
         return Decimal(cleaned)
@@ -101,6 +100,30 @@ def _parse_int(value: str) -> int:
         raise ValueError(f"Cannot parse integer: {value}")
 
 
+@lru_cache(maxsize=1024)
+def _parse_paid_at(value: str) -> Optional[str]:
+    """
+    Reduce a "Paid at" timestamp to an ISO date.
+
+    Formats: "2026-01-03 14:19:45 +0100", "2026-01-03T14:19:45", "01/03/2026 14:19:45"
+
+    Returns:
+        "YYYY-MM-DD", the stripped original if unrecognised, or None if empty
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    try:
+        return date.fromisoformat(value.split()[0].partition("T")[0]).isoformat()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%m/%d/%Y %H:%M:%S").date().isoformat()
+    except ValueError:
+        return value
+
+
 def _guess_artist_from_sku(sku: str) -> Optional[str]:
     """Guess artist from SKU code."""
     if not sku:
@@ -138,6 +161,23 @@ def _guess_artist_from_album(album_name: str) -> Optional[str]:
     return None
 
 
+# Format keywords that make a line item a physical package
+_PACKAGE_RE = re.compile(r'vinyl|cd|cassette|tape', re.IGNORECASE)
+
+# "Album by Artist - Format"
+_BY_RE = re.compile(r'^(.+?)\s+by\s+(.+?)\s*-\s*(.+)$', re.IGNORECASE)
+
+# Trailing parenthetical such as "(Remastered)"
+_PAREN_TAIL_RE = re.compile(r'\s*\([^)]*\)$')
+
+# Second segment of "X - <edition> - ..." when X is the album, not the artist
+_EDITION_RE = re.compile(r'limited|edition|vinyl|cd', re.IGNORECASE)
+
+# Second segment of "X - <format>" when X is the album, not the artist
+_FORMAT_RE = re.compile(r'vinyl|cd|12"|limited|edition|piano scores|all piano', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str, str]:
     """
     Parse artist and album from lineitem name.
@@ -153,15 +193,11 @@ def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str
     if not lineitem_name:
         return ("Unknown Artist", "Unknown Album", "other")
 
-    # Detect item type from format indicators
-    item_type = "album"  # default
-    if any(fmt in lineitem_name.lower() for fmt in ["vinyl", "cd", "cassette", "tape"]):
-        item_type = "package"
-    elif "score" in lineitem_name.lower() or "pdf" in lineitem_name.lower():
-        item_type = "album"  # Digital scores
+    # Detect item type from format indicators (digital scores keep the album default)
+    item_type = "package" if _PACKAGE_RE.search(lineitem_name) else "album"
 
     # Try "Album by Artist - Format" pattern
-    by_match = re.match(r'^(.+?)\s+by\s+(.+?)\s*-\s*(.+)$', lineitem_name, re.IGNORECASE)
+    by_match = _BY_RE.match(lineitem_name)
     if by_match:
         album = by_match.group(1).strip()
         artist = by_match.group(2).strip()
@@ -175,7 +211,7 @@ def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str
 
         # Check if first part looks like album without artist
         # (e.g., "INSIGHT II - Limited Edition 12" Vinyl - ...")
-        if any(fmt in second_part.lower() for fmt in ["limited", "edition", "vinyl", "cd"]):
+        if _EDITION_RE.search(second_part):
             # First part is album, not artist
             artist = _guess_artist_from_sku(sku)
             if not artist:
@@ -188,7 +224,7 @@ def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str
         artist = first_part
         album = second_part
         # Clean up album name: remove parentheticals like (Remastered)
-        album = re.sub(r'\s*\([^)]*\)$', '', album)
+        album = _PAREN_TAIL_RE.sub('', album)
         return (artist, album, item_type)
     elif len(dash_parts) == 2:
         # "Artist - Album" or "Album - Format"
@@ -196,7 +232,7 @@ def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str
         second_part = dash_parts[1].strip()
 
         # If second part looks like a format/edition, first is album (no artist)
-        if any(fmt in second_part.lower() for fmt in ["vinyl", "cd", "12\"", "limited", "edition", "piano scores", "all piano"]):
+        if _FORMAT_RE.search(second_part):
             # Try to guess artist from SKU first
             artist = _guess_artist_from_sku(sku)
             if not artist:
@@ -213,55 +249,126 @@ def _parse_artist_and_album(lineitem_name: str, sku: str = "") -> tuple[str, str
     return ("Unknown Artist", lineitem_name, item_type)
 
 
+# Orders export columns read by the parser, in unpacking order
+_ORDER_COLUMNS = (
+    "Order ID", "Email", "Paid at", "Currency", "Total", "Payment Method",
+    "Lineitem name", "Lineitem price", "Lineitem quantity", "Lineitem sku", "Lineitem variant",
+)
+
+# Products export columns read by the parser, in unpacking order
+_PRODUCT_COLUMNS = (
+    "Title", "Product Type [Non Editable]", "SKU", "GTIN", "Option Value 1", "Stock",
+)
+
+
+def _column_getter(headers: List[str], columns: Tuple[str, ...]) -> Tuple[itemgetter, int]:
+    """
+    Build an itemgetter returning the named columns of a csv.reader row.
+
+    Absent columns read a trailing blank slot, so rows must first be fitted to
+    the returned width (padded, and cut after the last header). Like csv.DictReader, a duplicated header maps to its
+    last occurrence.
+    """
+    positions = {header: index for index, header in enumerate(headers)}
+    blank = len(headers)
+    return itemgetter(*(positions.get(column, blank) for column in columns)), blank + 1
+
+
+def _is_products_format(content: str) -> bool:
+    """Detect the products (catalogue) export from the first header line."""
+    first_line = content.split("\n", 1)[0] if content else ""
+    if "Order ID" in first_line:
+        return False
+    # Default to orders format for backward-compatibility
+    return "Product ID" in first_line or "Variant ID" in first_line or "Product Type" in first_line
+
+
 class SquarespaceParser:
     """Parser for Squarespace order CSV files."""
 
-    def _parse_orders(self, content: str) -> Dict[str, Dict]:
+    def __init__(self):
+        # Per-file memo of converted price/quantity cells (prices repeat per product)
+        self._prices: Dict[str, Decimal] = {}
+        self._quantities: Dict[str, int] = {}
+        # Low-cardinality order columns share one string object per distinct value
+        self._strings: Dict[str, str] = {}
+
+    def _iter_orders(self, content: str) -> Iterator[Dict]:
         """
-        Parse Squarespace CSV into grouped orders.
+        Group Squarespace CSV rows into orders.
 
-        Returns: Dict[order_id, order_data]
+        Squarespace lists an order's line items on consecutive rows (only the
+        first carries the Order ID), so each order is yielded as soon as the
+        next one starts and only the current order is held in memory.
         """
-        reader = csv.DictReader(io.StringIO(content))
-        orders = defaultdict(lambda: {
-            'order_id': '',
-            'email': '',
-            'paid_at': '',
-            'currency': 'EUR',
-            'total': '0',
-            'payment_method': '',
-            'items': []
-        })
-
-        current_order_id = None
+        reader = csv.reader(io.StringIO(content))
+        headers = next(reader, None)
+        if headers is None:
+            return
+        getter, width = _column_getter(headers, _ORDER_COLUMNS)
+        blank = width - 1
+
+        current_order: Optional[Dict] = None
+        self._strings = {}
+        intern = self._strings.setdefault
 
         for row in reader:
-            order_id = row.get('Order ID', '').strip()
+            if len(row) == blank:
+                row = row + [""]
+            else:
+                # Short rows are padded; cells past the header are dropped so that
+                # they can never be read as an absent column
+                row = row[:blank] + [""] * (width - min(len(row), blank))
+            (
+                order_id, email, paid_at, currency, total, payment_method,
+                lineitem_name, price, quantity, sku, variant,
+            ) = getter(row)
+            order_id = order_id.strip()
 
             # If we have an Order ID, update current order
             if order_id:
-                current_order_id = order_id
-                orders[order_id].update({
-                    'order_id': order_id,
-                    'email': row.get('Email', ''),
-                    'paid_at': row.get('Paid at', ''),
-                    'currency': row.get('Currency', 'EUR'),
-                    'total': row.get('Total', '0'),
-                    'payment_method': row.get('Payment Method', ''),
+                if current_order is None or current_order['order_id'] != order_id:
+                    if current_order is not None:
+                        yield current_order
+                    current_order = {'order_id': order_id, 'items': []}
+                current_order.update({
+                    'email': email,
+                    'paid_at': _parse_paid_at(paid_at),
+                    'currency': intern(currency, currency) or 'EUR',
+                    'total': total,
+                    'payment_method': intern(payment_method, payment_method),
                 })
 
             # Add lineitem if present (for both new order line and continuation lines)
-            lineitem_name = row.get('Lineitem name', '').strip()
-            if lineitem_name and current_order_id:
-                orders[current_order_id]['items'].append({
+            lineitem_name = lineitem_name.strip()
+            if lineitem_name and current_order is not None:
+                current_order['items'].append({
                     'name': lineitem_name,
-                    'price': row.get('Lineitem price', '0'),
-                    'quantity': row.get('Lineitem quantity', '1'),
-                    'sku': row.get('Lineitem sku', ''),
-                    'variant': row.get('Lineitem variant', ''),
+                    'price': price,
+                    'quantity': quantity,
+                    'sku': sku,
+                    'variant': variant,
                 })
 
-        return dict(orders)
+        if current_order is not None:
+            yield current_order
+
+    def _group_orders(self, content: str) -> Dict[str, Dict]:
+        """
+        Group Squarespace CSV rows into orders, keyed by Order ID.
+
+        An Order ID that appears again after other orders is merged into the
+        first occurrence: its items are appended and the later order fields win.
+        """
+        orders: Dict[str, Dict] = {}
+        for order in self._iter_orders(content):
+            existing = orders.setdefault(order['order_id'], order)
+            if existing is not order:
+                items = existing['items']
+                items.extend(order['items'])
+                existing.update(order)
+                existing['items'] = items
+        return orders
 
     def _parse_row(self, order_data: Dict, item: Dict, row_number: int) -> SquarespaceRow:
         """Parse a single order item into a SquarespaceRow."""
@@ -269,9 +376,15 @@ class SquarespaceParser:
         # Parse artist and album from lineitem name (using SKU as hint)
         artist, album, item_type = _parse_artist_and_album(item['name'], item.get('sku', ''))
 
-        # Parse amounts
-        net_amount = _parse_decimal(item['price'])
-        quantity = _parse_int(item['quantity'])
+        # Parse amounts (each distinct cell is converted once per file)
+        price = item['price']
+        net_amount = self._prices.get(price)
+        if net_amount is None:
+            net_amount = self._prices[price] = _parse_decimal(price)
+        quantity_str = item['quantity']
+        quantity = self._quantities.get(quantity_str)
+        if quantity is None:
+            quantity = self._quantities[quantity_str] = _parse_int(quantity_str)
 
         return SquarespaceRow(
             row_number=row_number,
@@ -282,7 +395,7 @@ class SquarespaceParser:
             quantity=quantity,
             net_amount=net_amount,
             currency=order_data['currency'],
-            date_from=order_data['paid_at'] or None,
+            date_from=order_data['paid_at'],
             sku=item['sku'] or None,
             variant=item['variant'] or None,
             payment_method=order_data['payment_method'] or None,
@@ -300,16 +413,32 @@ class SquarespaceParser:
         (where Title is empty) inherit the title of the preceding product.
         """
         result = SquarespaceParseResult()
-        reader = csv.DictReader(io.StringIO(content))
+        reader = csv.reader(io.StringIO(content))
+        headers = next(reader, None)
+        if headers is None:
+            return result
+        getter, width = _column_getter(headers, _PRODUCT_COLUMNS)
+        blank = width - 1
 
         current_title: str = ""
         current_is_physical: bool = False
+        rows_append = result.rows.append
 
-        for row_number, row in enumerate(reader, start=2):
+        # Blank lines are not rows (as with csv.DictReader)
+        rows = (row for row in reader if row)
+        for row_number, row in enumerate(rows, start=2):
             result.total_rows += 1
 
-            raw_title = row.get("Title", "").strip()
-            product_type = row.get("Product Type [Non Editable]", "").strip().upper()
+            if len(row) == blank:
+                row = row + [""]
+            else:
+                # Short rows are padded; cells past the header are dropped so that
+                # they can never be read as an absent column
+                row = row[:blank] + [""] * (width - min(len(row), blank))
+            raw_title, product_type, sku, gtin, option1, stock_str = (
+                value.strip() for value in getter(row)
+            )
+            product_type = product_type.upper()
 
             # A non-empty Title marks a new product (or the first variant row)
             if raw_title:
@@ -320,10 +449,9 @@ class SquarespaceParser:
             if not current_is_physical or not current_title:
                 continue
 
-            sku = row.get("SKU", "").strip() or None
-            gtin = row.get("GTIN", "").strip() or None
-            option1 = row.get("Option Value 1", "").strip() or None
-            stock_str = row.get("Stock", "0").strip()
+            sku = sku or None
+            gtin = gtin or None
+            option1 = option1 or None
 
             try:
                 stock = int(float(stock_str)) if stock_str else 0
@@ -336,7 +464,7 @@ class SquarespaceParser:
             # _parse_products already filtered for PHYSICAL product type.
             artist, album, _ = _parse_artist_and_album(current_title, sku or "")
 
-            result.rows.append(SquarespaceProductRow(
+            rows_append(SquarespaceProductRow(
                 row_number=row_number,
                 item_name=album,
                 artist=artist,
@@ -364,30 +492,13 @@ class SquarespaceParser:
         Returns:
             SquarespaceParseResult with parsed rows and errors
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")  # Handle BOM
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
-        # --- Format detection from first header line ---
-        first_line = content.split("\n")[0] if content else ""
-        if "Order ID" in first_line:
-            is_products_format = False
-        elif "Product ID" in first_line or "Variant ID" in first_line or "Product Type" in first_line:
-            is_products_format = True
-        else:
-            # Default to orders format for backward-compatibility
-            is_products_format = False
-
-        if is_products_format:
+        content = _decode(content)
+        if _is_products_format(content):
             return self._parse_products(content)
 
-        # --- Orders format (original logic) ---
         result = SquarespaceParseResult()
-
         try:
-            orders = self._parse_orders(content)
+            orders = self._group_orders(content)
         except Exception as e:
             result.errors.append(ParseError(
                 row_number=0,
@@ -395,36 +506,61 @@ class SquarespaceParser:
             ))
             return result
 
-        row_number = 2  # Start after header
-        for order_id, order_data in orders.items():
-            for item in order_data['items']:
-                result.total_rows += 1
-
-                try:
-                    parsed_row = self._parse_row(order_data, item, row_number)
-                    result.rows.append(parsed_row)
-                except (ValueError, KeyError) as e:
-                    result.errors.append(ParseError(
-                        row_number=row_number,
-                        error=str(e),
-                        raw_data={'order_id': order_id, 'item': item},
-                    ))
-
-                row_number += 1
-
+        rows_append = result.rows.append
+        errors_append = result.errors.append
+        for parsed in self._iter_order_rows(orders.values()):
+            if isinstance(parsed, ParseError):
+                errors_append(parsed)
+            else:
+                rows_append(parsed)
+        result.total_rows = len(result.rows) + len(result.errors)
         return result
 
-    def parse_iter(self, content: Union[str, bytes]) -> Iterator[Union[SquarespaceRow, ParseError]]:
+    def parse_iter(self, content: Union[str, bytes]) -> Iterator[Union[SquarespaceRow, SquarespaceProductRow, ParseError]]:
         """
         Parse Squarespace CSV content as an iterator.
 
+        Orders are parsed as they are read, so memory stays bounded by the
+        largest single order rather than the whole file. Unlike parse(), an
+        Order ID repeated after other orders is yielded again as a separate
+        order, and a CSV error mid-file comes after the rows read before it.
+
         Yields:
-            SquarespaceRow or ParseError for each item
+            SquarespaceRow (or SquarespaceProductRow) or ParseError for each item
         """
-        result = self.parse(content)
+        content = _decode(content)
+        if _is_products_format(content):
+            yield from self._parse_products(content).rows
+            return
+
+        yield from self._iter_order_rows(self._iter_orders(content))
+
+    def _iter_order_rows(self, orders: Iterable[Dict]) -> Iterator[Union[SquarespaceRow, ParseError]]:
+        """Yield a SquarespaceRow or ParseError for each line item of the given orders."""
+        self._prices = {}
+        self._quantities = {}
+        row_number = 2  # Start after header
+        orders = iter(orders)
+        while True:
+            try:
+                order_data = next(orders, None)
+            except Exception as e:
+                yield ParseError(
+                    row_number=0,
+                    error=f"Failed to parse CSV: {str(e)}",
+                )
+                return
+            if order_data is None:
+                return
 
-        for error in result.errors:
-            yield error
+            for item in order_data['items']:
+                try:
+                    yield self._parse_row(order_data, item, row_number)
+                except (ValueError, KeyError) as e:
+                    yield ParseError(
+                        row_number=row_number,
+                        error=str(e),
+                        raw_data={'order_id': order_data['order_id'], 'item': item},
+                    )
 
-        for row in result.rows:
-            yield row
+                row_number += 1
@@ -21,10 +21,15 @@ import io
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Iterator, List, Optional, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+from app.services.parsers._text import _decode
+from app.services.parsers._types import ParseError
 
-@dataclass
+
+@dataclass(slots=True)
 class SubmitHubRow:
     """Raw parsed row from SubmitHub CSV."""
     row_number: int
@@ -40,15 +45,7 @@ class SubmitHubRow:
     listen_time: Optional[int]  # seconds
 
 
-@dataclass
-class ParseError:
-    """Represents a parsing error for a specific row."""
-    row_number: int
-    error: str
-    raw_data: Optional[Dict] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class SubmitHubParseResult:
     """Result of parsing a SubmitHub CSV."""
     rows: List[SubmitHubRow] = field(default_factory=list)
@@ -57,6 +54,7 @@ class SubmitHubParseResult:
 
 
 # Column name mappings - tolerant to variations
+# (_parse_row unpacks fields in this order)
 COLUMN_MAPPINGS = {
     "song": ["song", "song title", "track", "track name", "title"],
     "campaign_url": ["campaign url", "campaign_url", "url", "link"],
@@ -73,49 +71,54 @@ COLUMN_MAPPINGS = {
 }
 
 
-def _find_column_index(headers: List[str], field_name: str) -> Optional[int]:
-    """Find column index by trying multiple possible names."""
-    possible_names = COLUMN_MAPPINGS.get(field_name, [field_name])
-    headers_lower = [h.lower().strip() for h in headers]
+def _build_header_map(headers: List[str]) -> Dict[str, int]:
+    """Map each lowercased header to its first column index."""
+    header_map: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        header_map.setdefault(header.lower().strip(), index)
+    return header_map
+
 
-    for name in possible_names:
-        if name.lower() in headers_lower:
-            return headers_lower.index(name.lower())
+def _find_column_index(header_map: Dict[str, int], field_name: str) -> Optional[int]:
+    """Find column index by trying multiple possible names."""
+    for name in COLUMN_MAPPINGS.get(field_name, [field_name]):
+        index = header_map.get(name)
+        if index is not None:
+            return index
     return None
 
 
-def _get_value(row: List[str], index: Optional[int], default: str = "") -> str:
-    """Safely get value from row by index."""
-    if index is None or index >= len(row):
-        return default
-    return row[index].strip()
+# Map various action formats to standard values
+_ACTION_MAP = {
+    "listened": "listen",
+    "listen": "listen",
+    "declined": "declined",
+    "decline": "declined",
+    "rejected": "declined",
+    "approved": "approved",
+    "approve": "approved",
+    "accepted": "approved",
+    "shared": "shared",
+    "share": "shared",
+    "posted": "shared",
+}
 
 
+@lru_cache(maxsize=4096)
 def _normalize_action(action_str: str) -> str:
     """Normalize SubmitHub action to standard values."""
     if not action_str:
         return "unknown"
 
     action_lower = action_str.lower().strip()
+    return _ACTION_MAP.get(action_lower, action_lower)
 
-    # Map various formats to standard values
-    mapping = {
-        "listened": "listen",
-        "listen": "listen",
-        "declined": "declined",
-        "decline": "declined",
-        "rejected": "declined",
-        "approved": "approved",
-        "approve": "approved",
-        "accepted": "approved",
-        "shared": "shared",
-        "share": "shared",
-        "posted": "shared",
-    }
 
-    return mapping.get(action_lower, action_lower)
+# Seconds, MM:SS or HH:MM:SS (spaces around the colons are allowed)
+_TIME_RE = re.compile(r'(?:(?:(\d+)\s*:\s*)?(\d+)\s*:\s*)?(\d+)')
 
 
+@lru_cache(maxsize=4096)
 def _parse_listen_time(time_str: str) -> Optional[int]:
     """Parse listen time to seconds.
 
@@ -127,27 +130,15 @@ def _parse_listen_time(time_str: str) -> Optional[int]:
     if not time_str:
         return None
 
-    time_str = time_str.strip()
-
-    # Try parsing as plain seconds first
-    if time_str.isdigit():
-        return int(time_str)
-
-    # Try parsing time format (HH:MM:SS or MM:SS)
-    time_parts = time_str.split(":")
-    try:
-        if len(time_parts) == 2:  # MM:SS
-            minutes, seconds = map(int, time_parts)
-            return minutes * 60 + seconds
-        elif len(time_parts) == 3:  # HH:MM:SS
-            hours, minutes, seconds = map(int, time_parts)
-            return hours * 3600 + minutes * 60 + seconds
-    except ValueError:
-        pass
+    match = _TIME_RE.fullmatch(time_str.strip())
+    if not match:
+        return None
 
-    return None
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds)
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(date_str: str) -> Optional[str]:
     """Parse date string to ISO format.
 
@@ -161,7 +152,13 @@ def _parse_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
 
-    # Common formats to try
+    # ISO dates and timestamps are the common case
+    try:
+        return datetime.fromisoformat(date_str).date().isoformat()
+    except ValueError:
+        pass
+
+    # Other formats to try
     formats = [
         "%Y-%m-%d",           # 2026-01-27
         "%m/%d/%Y",           # 01/27/2026
@@ -185,6 +182,13 @@ def _parse_date(date_str: str) -> Optional[str]:
     return date_str
 
 
+# Campaign URL pattern: /by/{artist}/{song}
+_CAMPAIGN_URL_RE = re.compile(r'/by/([^/]+)/([^/?]+)')
+# Slug separators -> spaces, in one pass
+_SLUG_SPACES = str.maketrans("-_", "  ")
+
+
+@lru_cache(maxsize=4096)
 def _extract_info_from_campaign_url(url: str) -> tuple[Optional[str], Optional[str]]:
     """Extract artist name and song title from SubmitHub campaign URL.
 
@@ -196,33 +200,41 @@ def _extract_info_from_campaign_url(url: str) -> tuple[Optional[str], Optional[s
     if not url:
         return None, None
 
-    # Parse URL pattern: /by/{artist}/{song}
-    pattern = r'/by/([^/]+)/([^/?]+)'
-    match = re.search(pattern, url)
+    match = _CAMPAIGN_URL_RE.search(url)
 
     if match:
-        artist_slug = match.group(1)
-        song_slug = match.group(2)
+        artist_slug, song_slug = match.groups()
 
         # Convert slug to readable format: "artist-name" -> "Artist Name"
-        artist_name = artist_slug.replace('-', ' ').replace('_', ' ').title()
-        song_title = song_slug.replace('-', ' ').replace('_', ' ').title()
+        artist_name = artist_slug.translate(_SLUG_SPACES).title()
+        song_title = song_slug.translate(_SLUG_SPACES).title()
 
         return artist_name, song_title
 
     return None, None
 
 
+def _detect_delimiter(content: str) -> str:
+    """Pick comma, semicolon or tab by frequency on the header line (comma if none)."""
+    first_line = content[:2000].split("\n", 1)[0]
+    delimiter = max((",", ";", "\t"), key=first_line.count)
+    return delimiter if first_line.count(delimiter) else ","
+
+
 class SubmitHubParser:
     """Parser for SubmitHub CSV files."""
 
     def __init__(self):
         self._column_indices: Dict[str, Optional[int]] = {}
+        self._row_width = 0
+        self._getter: Optional[itemgetter] = None
+        self._strings: Dict[str, str] = {}
 
     def _detect_columns(self, headers: List[str]) -> None:
         """Detect column indices from headers."""
+        header_map = _build_header_map(headers)
         for field_name in COLUMN_MAPPINGS:
-            self._column_indices[field_name] = _find_column_index(headers, field_name)
+            self._column_indices[field_name] = _find_column_index(header_map, field_name)
 
         # Validate required columns
         required = ["outlet", "action"]
@@ -232,14 +244,34 @@ class SubmitHubParser:
 
         # Note: "song" column is now optional - we extract from filename or campaign URL
 
+        # Absent columns point at a trailing blank slot so that every field can be
+        # fetched with a single itemgetter call (in COLUMN_MAPPINGS order).
+        blank = len(headers)
+        self._row_width = blank + 1
+        self._getter = itemgetter(*(
+            blank if index is None else index
+            for index in self._column_indices.values()
+        ))
+        self._strings = {}
+
     def _parse_row(self, row: List[str], row_number: int) -> SubmitHubRow:
         """Parse a single CSV row into a SubmitHubRow."""
-
-        # Get campaign URL (might be needed to extract song/artist)
-        campaign_url = _get_value(row, self._column_indices.get("campaign_url")) or None
-
-        # Try to get song title from column, or extract from URL
-        song_title = _get_value(row, self._column_indices.get("song"))
+        blank = self._row_width - 1
+        if len(row) == blank:
+            row = row + [""]
+        else:
+            # Short rows are padded; cells past the header are dropped so that they
+            # can never be read as an absent column
+            row = row[:blank] + [""] * (self._row_width - min(len(row), blank))
+
+        (
+            song_title, campaign_url, campaign_date_raw, outlet_name, outlet_type,
+            action_raw, action_timestamp_raw, feedback, additional_notes, sent_raw,
+            received_raw, listen_time_raw,
+        ) = [value.strip() for value in self._getter(row)]
+
+        # Campaign URL might be needed to extract song/artist
+        campaign_url = campaign_url or None
         artist_name = None
 
         if not song_title and campaign_url:
@@ -250,26 +282,23 @@ class SubmitHubParser:
         if not song_title:
             song_title = "Unknown"  # Will be overridden from filename in the API endpoint
 
-        outlet_name = _get_value(row, self._column_indices.get("outlet"))
         if not outlet_name:
             raise ValueError("Missing outlet name")
 
-        action_raw = _get_value(row, self._column_indices.get("action"))
+        # Low-cardinality columns share one string object per distinct value
+        intern = self._strings.setdefault
         action = _normalize_action(action_raw)
-
-        listen_time_raw = _get_value(row, self._column_indices.get("listen_time"))
+        action = intern(action, action)
+        outlet_type = intern(outlet_type, outlet_type)
         listen_time = _parse_listen_time(listen_time_raw)
 
         # Try to get dates from multiple possible columns
-        sent_date_raw = _get_value(row, self._column_indices.get("sent")) or _get_value(row, self._column_indices.get("campaign_date"))
-        sent_date = _parse_date(sent_date_raw)
-
-        received_date_raw = _get_value(row, self._column_indices.get("received")) or _get_value(row, self._column_indices.get("action_timestamp"))
-        received_date = _parse_date(received_date_raw)
+        sent_date = _parse_date(sent_raw or campaign_date_raw)
+        received_date = _parse_date(received_raw or action_timestamp_raw)
 
         # Combine feedback and additional notes
-        feedback = _get_value(row, self._column_indices.get("feedback")) or None
-        additional_notes = _get_value(row, self._column_indices.get("additional_notes")) or None
+        feedback = feedback or None
+        additional_notes = additional_notes or None
         if feedback and additional_notes:
             feedback = f"{feedback}\n\nAdditional notes: {additional_notes}"
         elif additional_notes:
@@ -281,7 +310,7 @@ class SubmitHubParser:
             artist_name=artist_name,
             campaign_url=campaign_url,
             outlet_name=outlet_name,
-            outlet_type=_get_value(row, self._column_indices.get("outlet_type")) or None,
+            outlet_type=outlet_type or None,
             action=action,
             feedback=feedback,
             sent_date=sent_date,
@@ -289,6 +318,19 @@ class SubmitHubParser:
             listen_time=listen_time,
         )
 
+    def _make_reader(self, content: Union[str, bytes]) -> Tuple[Optional[List[str]], Iterator[List[str]]]:
+        """
+        Decode content and open a csv.reader on it.
+
+        Returns:
+            (headers, reader) where headers is None for an empty file
+        """
+        content = _decode(content)
+
+        # Use csv.reader for robust parsing
+        reader = csv.reader(io.StringIO(content), delimiter=_detect_delimiter(content))
+        return next(reader, None), reader
+
     def parse(self, content: Union[str, bytes]) -> SubmitHubParseResult:
         """
         Parse SubmitHub CSV content.
@@ -299,29 +341,10 @@ class SubmitHubParser:
         Returns:
             SubmitHubParseResult with parsed rows and errors
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")  # Handle BOM
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
         result = SubmitHubParseResult()
 
-        # Detect delimiter (comma, semicolon, or tab)
-        sample = content[:2000] if len(content) > 2000 else content
-        sniffer = csv.Sniffer()
-        try:
-            delimiter = sniffer.sniff(sample).delimiter
-        except csv.Error:
-            # Default to comma if detection fails
-            delimiter = ','
-
-        # Use csv.reader for robust parsing
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
-
-        try:
-            headers = next(reader)
-        except StopIteration:
+        headers, reader = self._make_reader(content)
+        if headers is None:
             result.errors.append(ParseError(
                 row_number=0,
                 error="Empty CSV file",
@@ -340,14 +363,18 @@ class SubmitHubParser:
         for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
             result.total_rows += 1
 
-            # Skip empty rows
-            if not row or all(cell.strip() == "" for cell in row):
+            # Skip empty lines
+            if not row:
                 continue
 
             try:
                 parsed_row = self._parse_row(row, row_number)
                 result.rows.append(parsed_row)
             except (ValueError, IndexError) as e:
+                # Blank rows always fail (outlet is required), so they are only
+                # told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
                 result.errors.append(ParseError(
                     row_number=row_number,
                     error=str(e),
@@ -363,26 +390,8 @@ class SubmitHubParser:
         Yields:
             SubmitHubRow or ParseError for each row
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
-        # Detect delimiter (comma, semicolon, or tab)
-        sample = content[:2000] if len(content) > 2000 else content
-        sniffer = csv.Sniffer()
-        try:
-            delimiter = sniffer.sniff(sample).delimiter
-        except csv.Error:
-            # Default to comma if detection fails
-            delimiter = ','
-
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
-
-        try:
-            headers = next(reader)
-        except StopIteration:
+        headers, reader = self._make_reader(content)
+        if headers is None:
             yield ParseError(row_number=0, error="Empty CSV file")
             return
 
@@ -393,12 +402,14 @@ class SubmitHubParser:
             return
 
         for row_number, row in enumerate(reader, start=2):
-            if not row or all(cell.strip() == "" for cell in row):
+            if not row:
                 continue
 
             try:
                 yield self._parse_row(row, row_number)
             except (ValueError, IndexError) as e:
+                if not "".join(row).strip():
+                    continue
                 yield ParseError(
                     row_number=row_number,
                     error=str(e),
@@ -6,13 +6,16 @@ Returns raw parsed data for normalization.
 """
 
 import csv
-import io
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Iterator, List, Optional, Union
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, TextIO, Union
 
+from app.services.parsers._text import _open_text
+from app.services.parsers._types import ParseError
 
-@dataclass
+
+@dataclass(slots=True)
 class TuneCoreRow:
     """Raw parsed row from TuneCore CSV."""
     row_number: int
@@ -30,15 +33,7 @@ class TuneCoreRow:
     store_name: Optional[str] = None
 
 
-@dataclass
-class ParseError:
-    """Represents a parsing error for a specific row."""
-    row_number: int
-    error: str
-    raw_data: Optional[Dict] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class TuneCoreParseResult:
     """Result of parsing a TuneCore CSV."""
     rows: List[TuneCoreRow] = field(default_factory=list)
@@ -47,6 +42,7 @@ class TuneCoreParseResult:
 
 
 # Column name mappings - tolerant to minor variations
+# (_parse_row unpacks fields in this order)
 COLUMN_MAPPINGS = {
     "artist": ["artist", "artist name", "artist_name"],
     "release_title": ["release title", "release_title", "album", "album title"],
@@ -63,52 +59,74 @@ COLUMN_MAPPINGS = {
 }
 
 
-def _find_column_index(headers: List[str], field_name: str) -> Optional[int]:
-    """Find column index by trying multiple possible names."""
-    possible_names = COLUMN_MAPPINGS.get(field_name, [field_name])
-    headers_lower = [h.lower().strip() for h in headers]
+def _build_header_map(headers: List[str]) -> Dict[str, int]:
+    """Map each lowercased header to its first column index."""
+    header_map: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        header_map.setdefault(header.lower().strip(), index)
+    return header_map
+
 
-    for name in possible_names:
-        if name.lower() in headers_lower:
-            return headers_lower.index(name.lower())
+def _find_column_index(header_map: Dict[str, int], field_name: str) -> Optional[int]:
+    """Find column index by trying multiple possible names."""
+    for name in COLUMN_MAPPINGS.get(field_name, [field_name]):
+        index = header_map.get(name)
+        if index is not None:
+            return index
     return None
 
 
-def _get_value(row: List[str], index: Optional[int], default: str = "") -> str:
-    """Safely get value from row by index."""
-    if index is None or index >= len(row):
-        return default
-    return row[index].strip()
+# Characters dropped from amounts: currency symbols and thousands separators
+_DEC_STRIP = str.maketrans("", "", "$€£,")
+
+_DEC_ZERO = Decimal("0")
 
 
-def _parse_decimal(value: str) -> Decimal:
-    """Parse decimal value, handling various formats."""
+def _parse_decimal(value: str) -> Optional[Decimal]:
+    """Parse decimal value, handling various formats (None if unparseable)."""
     if not value:
-        return Decimal("0")
+        return _DEC_ZERO
 
-    # Remove currency symbols and whitespace
-    cleaned = value.replace("$", "").replace("€", "").replace("£", "").strip()
+    # Remove currency symbols, thousands separators and whitespace
+    cleaned = value.translate(_DEC_STRIP).strip()
     # Handle negative in parentheses: (123.45) -> -123.45
-    if cleaned.startswith("(") and cleaned.endswith(")"):
+    if cleaned[:1] == "(" and cleaned[-1:] == ")":
         cleaned = "-" + cleaned[1:-1]
-    # Remove thousands separators
-    cleaned = cleaned.replace(",", "")
 
     try:
         return Decimal(cleaned)
     except InvalidOperation:
-        raise ValueError(f"Cannot parse decimal: {value}")
+        return None
 
 
-def _parse_int(value: str) -> int:
-    """Parse integer value."""
+def _parse_int(value: str) -> Optional[int]:
+    """Parse integer value (None if unparseable)."""
     if not value:
         return 0
     try:
         # Handle decimal units (e.g., "1.0" -> 1)
         return int(float(value.replace(",", "")))
-    except ValueError:
-        raise ValueError(f"Cannot parse integer: {value}")
+    except (ValueError, OverflowError):
+        return None
+
+
+# Memo marker for cells not converted yet (None means "unparseable")
+_UNSEEN = object()
+
+
+def _split_rows(stream: TextIO) -> Iterator[List[str]]:
+    """Split an unquoted CSV stream into rows, as csv.reader would."""
+    for line in stream:
+        line = line.rstrip("\n")
+        yield line.split(",") if line else []
+
+
+def _make_reader(content: Union[str, bytes]) -> Iterator[List[str]]:
+    """Open a row reader on CSV content."""
+    if ('"' if isinstance(content, str) else b'"') in content:
+        return csv.reader(_open_text(content, newline=""))
+    # No quoted fields: plain comma splitting yields the same rows, faster
+    return _split_rows(_open_text(content, newline=None))
 
 
 class TuneCoreParser:
@@ -116,11 +134,16 @@ class TuneCoreParser:
 
     def __init__(self):
         self._column_indices: Dict[str, Optional[int]] = {}
+        self._row_width = 0
+        self._getter: Optional[itemgetter] = None
+        # Per-file memo of converted unit cells (a handful of distinct values)
+        self._units: Dict[str, Optional[int]] = {}
 
     def _detect_columns(self, headers: List[str]) -> None:
         """Detect column indices from headers."""
+        header_map = _build_header_map(headers)
         for field_name in COLUMN_MAPPINGS:
-            self._column_indices[field_name] = _find_column_index(headers, field_name)
+            self._column_indices[field_name] = _find_column_index(header_map, field_name)
 
         # Validate required columns
         required = ["artist", "total_earned"]
@@ -128,32 +151,63 @@ class TuneCoreParser:
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
 
+        # Absent columns point at a trailing blank slot so that every field can be
+        # fetched with a single itemgetter call (in COLUMN_MAPPINGS order).
+        blank = len(headers)
+        self._row_width = blank + 1
+        self._getter = itemgetter(*(
+            blank if index is None else index
+            for index in self._column_indices.values()
+        ))
+        self._units = {}
+
     def _parse_row(self, row: List[str], row_number: int) -> TuneCoreRow:
         """Parse a single CSV row into a TuneCoreRow."""
-        artist = _get_value(row, self._column_indices.get("artist"))
+        blank = self._row_width - 1
+        if len(row) == blank:
+            row = row + [""]
+        else:
+            # Short rows are padded; cells past the header are dropped so that they
+            # can never be read as an absent column
+            row = row[:blank] + [""] * (self._row_width - min(len(row), blank))
+
+        (
+            artist, release_title, song_title, isrc, upc, country_of_sale,
+            sales_type, units_str, total_earned_str, currency, sales_period,
+            store_name,
+        ) = [value.strip() for value in self._getter(row)]
+
         if not artist:
             raise ValueError("Artist name is required")
 
-        total_earned_str = _get_value(row, self._column_indices.get("total_earned"), "0")
         total_earned = _parse_decimal(total_earned_str)
-
-        units_str = _get_value(row, self._column_indices.get("units_sold"), "0")
-        units_sold = _parse_int(units_str)
+        # Each distinct units cell is converted once per file, bad cells included
+        units_sold = self._units.get(units_str, _UNSEEN)
+        if units_sold is _UNSEEN:
+            units_sold = self._units[units_str] = _parse_int(units_str)
+
+        if total_earned is None or units_sold is None:
+            problems = []
+            if total_earned is None:
+                problems.append(f"Cannot parse decimal: {total_earned_str}")
+            if units_sold is None:
+                problems.append(f"Cannot parse integer: {units_str}")
+            raise ValueError("; ".join(problems))
 
         return TuneCoreRow(
             row_number=row_number,
             artist=artist,
-            release_title=_get_value(row, self._column_indices.get("release_title")),
-            song_title=_get_value(row, self._column_indices.get("song_title")),
-            isrc=_get_value(row, self._column_indices.get("isrc")) or None,
-            upc=_get_value(row, self._column_indices.get("upc")) or None,
-            country_of_sale=_get_value(row, self._column_indices.get("country_of_sale")) or None,
-            sales_type=_get_value(row, self._column_indices.get("sales_type")) or None,
+            release_title=release_title,
+            song_title=song_title,
+            isrc=isrc or None,
+            upc=upc or None,
+            country_of_sale=country_of_sale or None,
+            sales_type=sales_type or None,
             units_sold=units_sold,
             total_earned=total_earned,
-            currency=_get_value(row, self._column_indices.get("currency"), "USD"),
-            sales_period=_get_value(row, self._column_indices.get("sales_period")),
-            store_name=_get_value(row, self._column_indices.get("store_name")) or None,
+            currency=currency or "USD",
+            sales_period=sales_period,
+            store_name=store_name or None,
         )
 
     def parse(self, content: Union[str, bytes]) -> TuneCoreParseResult:
@@ -166,17 +220,9 @@ class TuneCoreParser:
         Returns:
             TuneCoreParseResult with parsed rows and errors
         """
-        if isinstance(content, bytes):
-            # Try UTF-8 first, then latin-1 as fallback
-            try:
-                content = content.decode("utf-8-sig")  # Handle BOM
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
         result = TuneCoreParseResult()
 
-        # Use csv.reader for robust parsing
-        reader = csv.reader(io.StringIO(content))
+        reader = _make_reader(content)
 
         try:
             headers = next(reader)
@@ -196,23 +242,33 @@ class TuneCoreParser:
             ))
             return result
 
-        for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
-            result.total_rows += 1
+        # Bind the per-row callables once and count rows from the enumerate
+        # cursor instead of touching result attributes on every row
+        parse_row = self._parse_row
+        append_row = result.rows.append
+        append_error = result.errors.append
 
-            # Skip empty rows
-            if not row or all(cell.strip() == "" for cell in row):
+        row_number = 1
+        for row_number, row in enumerate(reader, start=2):  # Start at 2 (1-indexed, after header)
+            # Skip empty lines
+            if not row:
                 continue
 
             try:
-                parsed_row = self._parse_row(row, row_number)
-                result.rows.append(parsed_row)
+                append_row(parse_row(row, row_number))
             except (ValueError, IndexError) as e:
-                result.errors.append(ParseError(
+                # Blank rows always fail (artist is required), so they are only
+                # told apart from real errors once parsing has failed
+                if not "".join(row).strip():
+                    continue
+                append_error(ParseError(
                     row_number=row_number,
                     error=str(e),
                     raw_data=dict(zip(headers[:len(row)], row)) if row else None,
                 ))
 
+        self._units = {}
+        result.total_rows = row_number - 1
         return result
 
     def parse_iter(self, content: Union[str, bytes]) -> Iterator[Union[TuneCoreRow, ParseError]]:
@@ -222,13 +278,7 @@ class TuneCoreParser:
         Yields:
             TuneCoreRow or ParseError for each row
         """
-        if isinstance(content, bytes):
-            try:
-                content = content.decode("utf-8-sig")
-            except UnicodeDecodeError:
-                content = content.decode("latin-1")
-
-        reader = csv.reader(io.StringIO(content))
+        reader = _make_reader(content)
 
         try:
             headers = next(reader)
@@ -242,15 +292,21 @@ class TuneCoreParser:
             yield ParseError(row_number=0, error=str(e))
             return
 
-        for row_number, row in enumerate(reader, start=2):
-            if not row or all(cell.strip() == "" for cell in row):
-                continue
-
-            try:
-                yield self._parse_row(row, row_number)
-            except (ValueError, IndexError) as e:
-                yield ParseError(
-                    row_number=row_number,
-                    error=str(e),
-                    raw_data=dict(zip(headers[:len(row)], row)) if row else None,
-                )
+        parse_row = self._parse_row
+        try:
+            for row_number, row in enumerate(reader, start=2):
+                if not row:
+                    continue
+
+                try:
+                    yield parse_row(row, row_number)
+                except (ValueError, IndexError) as e:
+                    if not "".join(row).strip():
+                        continue
+                    yield ParseError(
+                        row_number=row_number,
+                        error=str(e),
+                        raw_data=dict(zip(headers[:len(row)], row)) if row else None,
+                    )
+        finally:
+            self._units = {}
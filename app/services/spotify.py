@@ -4,43 +4,321 @@ Spotify API service for fetching artist and album artwork.
 Uses the Spotify Web API with client credentials flow.
 https://developer.spotify.com/documentation/web-api
 
-Includes in-memory caching to minimize API requests and avoid rate limits.
+Includes in-memory caching (optionally backed by SQLite, see SPOTIFY_CACHE_PATH)
+to minimize API requests and avoid rate limits.
 """
 from __future__ import annotations
 
 import asyncio
 import base64
+import heapq
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache with TTL
-_cache: Dict[str, tuple[Any, datetime]] = {}
-CACHE_TTL = timedelta(hours=24)  # Cache results for 24 hours
+# In-memory LRU cache with TTL; values are (result, monotonic expiry time)
+_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+CACHE_TTL = 24 * 3600  # Cache results for 24 hours (seconds)
+CACHE_MAX_ENTRIES = 10_000  # Least recently used entries are evicted beyond this
+NEGATIVE_CACHE_TTL = 3600  # Confirmed "not found" results are retried after an hour
+
+# (expiry, key) per in-memory write, earliest first, so expired entries can be
+# dropped without scanning the cache; pairs for refreshed or evicted keys are skipped
+_expiry_heap: list[tuple[float, str]] = []
+
+# Returned by _get_cached when nothing is cached (None is a cached "not found")
+_MISS = object()
+
+# Spotify calls currently in flight, keyed by (endpoint, sorted params)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Longest Retry-After we are willing to honour for a single rate-limited call
+MAX_RETRY_DELAY = 30.0
+
+
+# On-disk cache connection, opened on first use when SPOTIFY_CACHE_PATH is set.
+# All SQLite work runs on one worker thread, never on the event loop.
+_disk: Optional[sqlite3.Connection] = None
+_disk_unavailable = False
+_disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spotify-cache")
+# Seconds a locked database (another worker writing) may stall a disk cache call
+DISK_BUSY_TIMEOUT = 0.5
+
+
+def _disk_cache() -> Optional[sqlite3.Connection]:
+    """Return the SQLite cache connection, or None if disabled or unusable."""
+    global _disk, _disk_unavailable
+    if _disk is not None or _disk_unavailable:
+        return _disk
+    if not settings.SPOTIFY_CACHE_PATH:
+        _disk_unavailable = True
+        return None
+
+    try:
+        conn = sqlite3.connect(
+            settings.SPOTIFY_CACHE_PATH,
+            timeout=DISK_BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS spotify_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+        conn.execute("DELETE FROM spotify_cache WHERE expires_at <= ?", (int(time.time()),))
+    except sqlite3.Error as e:
+        logger.warning(f"Spotify disk cache disabled ({settings.SPOTIFY_CACHE_PATH}): {e}")
+        _disk_unavailable = True
+        return None
+
+    _disk = conn
+    return _disk
+
+
+def _disk_read(key: str) -> Optional[tuple[str, int]]:
+    """(value, expires_at) stored on disk for a key, or None. Runs on the disk thread."""
+    conn = _disk_cache()
+    if conn is None:
+        return None
+    try:
+        return conn.execute(
+            "SELECT value, expires_at FROM spotify_cache WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Spotify disk cache read failed for {key}: {e}")
+        return None
+
+
+def _disk_write(key: str, value: str, expires_at: int) -> None:
+    """Store a serialized value on disk. Runs on the disk thread."""
+    conn = _disk_cache()
+    if conn is None:
+        return
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO spotify_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at),
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Spotify disk cache write failed for {key}: {e}")
+
+
+def _disk_purge() -> int:
+    """Delete expired rows from the disk cache. Runs on the disk thread."""
+    conn = _disk_cache()
+    if conn is None:
+        return 0
+    try:
+        return conn.execute("DELETE FROM spotify_cache WHERE expires_at <= ?", (int(time.time()),)).rowcount
+    except sqlite3.Error as e:
+        logger.warning(f"Spotify disk cache purge failed: {e}")
+        return 0
+
+
+def _disk_close() -> None:
+    """Close the disk cache connection, if open. Runs on the disk thread."""
+    global _disk, _disk_unavailable
+    if _disk is not None:
+        _disk.close()
+        _disk = None
+    _disk_unavailable = True
+
+
+async def _on_disk_thread(fn, *args):
+    """Run a disk cache function on the dedicated SQLite thread."""
+    return await asyncio.get_running_loop().run_in_executor(_disk_executor, fn, *args)
+
+
+def _remember(key: str, value: Any, ttl: float) -> None:
+    """Store a value in the in-memory cache, evicting the least recently used entries when full."""
+    expires = time.monotonic() + ttl
+    _cache[key] = (value, expires)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+    heapq.heappush(_expiry_heap, (expires, key))
+    if len(_expiry_heap) > 2 * CACHE_MAX_ENTRIES:
+        # Mostly stale pairs by now: rebuild from the live entries
+        _expiry_heap[:] = [(exp, k) for k, (_, exp) in _cache.items()]
+        heapq.heapify(_expiry_heap)
+
+
+def purge_expired() -> int:
+    """
+    Drop expired entries from the in-memory cache.
+
+    Only the expired part of the heap is visited. Returns the number of entries removed.
+    """
+    now = time.monotonic()
+    removed = 0
+    while _expiry_heap and _expiry_heap[0][0] <= now:
+        _, key = heapq.heappop(_expiry_heap)
+        entry = _cache.get(key)
+        if entry is not None and entry[1] <= now:
+            del _cache[key]
+            removed += 1
+    return removed
+
+
+async def purge_expired_disk() -> int:
+    """Delete expired rows from the disk cache (if enabled). Returns the number removed."""
+    if not settings.SPOTIFY_CACHE_PATH:
+        return 0
+    return await _on_disk_thread(_disk_purge)
 
 
-def _get_cached(key: str) -> Optional[Any]:
-    """Get a cached value if it exists and hasn't expired."""
-    if key in _cache:
-        value, expires = _cache[key]
-        if datetime.utcnow() < expires:
+async def close_disk_cache() -> None:
+    """Close the disk cache connection and stop its thread (on shutdown)."""
+    await _on_disk_thread(_disk_close)
+    _disk_executor.shutdown(wait=False)
+
+
+async def _get_cached(key: str) -> Any:
+    """
+    Get a cached value if it exists and hasn't expired (memory first, then disk).
+
+    Returns _MISS when there is no usable entry.
+    """
+    hit = _cache.get(key)
+    if hit is not None:
+        value, expires = hit
+        if time.monotonic() < expires:
+            _cache.move_to_end(key)
             logger.debug(f"Cache hit for {key}")
             return value
-        else:
-            del _cache[key]
-    return None
+        del _cache[key]
+
+    if _disk_unavailable:
+        return _MISS
+    row = await _on_disk_thread(_disk_read, key)
+    if row is None:
+        return _MISS
+
+    remaining = row[1] - time.time()
+    if remaining <= 0:
+        return _MISS
+    value = orjson.loads(row[0])
+    _remember(key, value, remaining)
+    logger.debug(f"Disk cache hit for {key}")
+    return value
+
+
+async def _set_cached(key: str, value: Any, ttl: float = CACHE_TTL) -> None:
+    """Cache a value with TTL (in memory, and on disk when enabled)."""
+    _remember(key, value, ttl)
+
+    if _disk_unavailable:
+        return
+    await _on_disk_thread(_disk_write, key, orjson.dumps(value).decode(), int(time.time() + ttl))
+
+
+async def _set_not_found(key: str, result: dict, kind: str) -> None:
+    """
+    Cache a search that returned no `kind` items as "not found" (None), for NEGATIVE_CACHE_TTL.
+
+    Failed calls come back from _send as {} without the result key; those are
+    not cached so the next lookup retries them.
+    """
+    if kind in result:
+        await _set_cached(key, None, NEGATIVE_CACHE_TTL)
+
+
+def _retry_delay(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited (429) response."""
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = 2.0 ** attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def _image_urls(images: Optional[list]) -> tuple[Optional[str], Optional[str]]:
+    """(largest, smallest) URL of a Spotify images list, which is ordered largest first."""
+    if not images:
+        return None, None
+    return images[0]["url"], images[-1]["url"]
+
+
+def _shape_album(album: dict) -> dict:
+    """Album summary returned by the artist album listings."""
+    get = album.get
+    image_url, image_url_small = _image_urls(get("images"))
+    return {
+        "spotify_id": get("id"),
+        "name": get("name"),
+        "album_type": get("album_type"),
+        "release_date": get("release_date"),
+        "total_tracks": get("total_tracks"),
+        "image_url": image_url,
+        "image_url_small": image_url_small,
+        "artists": [a.get("name") for a in get("artists", [])],
+        "external_urls": get("external_urls", {}),
+    }
+
+
+class _AdaptiveLimit:
+    """
+    AIMD limit on concurrent Spotify calls.
 
+    The limit grows by one after every `window` successful calls and is halved
+    (at most once per second) when Spotify answers 429 or 5xx.
+    """
 
-def _set_cached(key: str, value: Any) -> None:
-    """Cache a value with TTL."""
-    _cache[key] = (value, datetime.utcnow() + CACHE_TTL)
+    def __init__(self, maximum: int, window: int = 20):
+        self.limit = maximum
+        self._maximum = maximum
+        self._window = window
+        self._successes = 0
+        self._last_cut = 0.0
+        self._active = 0
+        # Created on first use and per event loop: the service outlives loops
+        # (module singleton, tests, reloads) but an asyncio.Condition can't
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Condition] = None
+
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._changed = asyncio.Condition()
+            self._active = 0
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._changed:
+            self._active -= 1
+            self._changed.notify_all()
+
+    def success(self) -> None:
+        self._successes += 1
+        if self._successes >= self._window and self.limit < self._maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def backoff(self) -> None:
+        now = time.monotonic()
+        # Many calls in flight see the same overload: cut once per burst
+        if now - self._last_cut >= 1.0:
+            self.limit = max(1, self.limit // 2)
+            self._last_cut = now
+        self._successes = 0
 
 
 class SpotifyService:
@@ -54,9 +332,36 @@ class SpotifyService:
     BASE_URL = "https://api.spotify.com/v1"
     AUTH_URL = "https://accounts.spotify.com/api/token"
 
+    # Upper bound on simultaneous connections per host kept alive in the pool
+    POOL_SIZE = 20
+    # Concurrent lookups in batch searches (Spotify allows roughly 20 req/s)
+    MAX_CONCURRENCY = 20
+    # Attempts after a 429 before giving up on a request
+    MAX_RETRIES = 3
+    # Pages of one paginated listing fetched at the same time
+    PAGE_CONCURRENCY = 8
+
     def __init__(self):
         self._access_token: Optional[str] = None
-        self._token_expires: Optional[datetime] = None
+        # Monotonic time after which the token should be refreshed
+        self._token_expires = 0.0
+
+        # One session for all calls so TLS connections are kept alive and reused
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.POOL_SIZE)
+        self._session.mount("https://", adapter)
+
+        # Backs off on rate limits / server errors, then recovers gradually
+        self._limit = _AdaptiveLimit(self.MAX_CONCURRENCY)
+        # Send times within the last minute, for SPOTIFY_MAX_RPM
+        self._sent: deque[float] = deque()
+        # Serializes token refreshes; created per event loop like the limiter's condition
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
 
     async def _get_access_token(self) -> str:
         """
@@ -65,11 +370,22 @@ class SpotifyService:
         Uses client credentials flow (no user authorization required).
         """
         # Check if we have a valid token
-        if self._access_token and self._token_expires:
-            if datetime.utcnow() < self._token_expires - timedelta(minutes=1):
+        if self._access_token and time.monotonic() < self._token_expires:
+            return self._access_token
+
+        loop = asyncio.get_running_loop()
+        if self._token_lock_loop is not loop:
+            self._token_lock_loop = loop
+            self._token_lock = asyncio.Lock()
+
+        # Only one caller fetches; the others wait and reuse its token
+        async with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expires:
                 return self._access_token
+            return await self._fetch_token()
 
-        # Get new token
+    async def _fetch_token(self) -> str:
+        """Request a new access token from the Spotify accounts service."""
         client_id = settings.SPOTIFY_CLIENT_ID
         client_secret = settings.SPOTIFY_CLIENT_SECRET
 
@@ -81,7 +397,7 @@ class SpotifyService:
         encoded = base64.b64encode(credentials.encode()).decode()
 
         def _do_auth() -> requests.Response:
-            return requests.post(
+            return self._session.post(
                 self.AUTH_URL,
                 headers={
                     "Authorization": f"Basic {encoded}",
@@ -98,19 +414,53 @@ class SpotifyService:
             logger.error(f"Failed to get Spotify token: {response.status_code} {response.text[:200]}")
             raise ValueError("Failed to authenticate with Spotify")
 
-        data = response.json()
+        data = orjson.loads(response.content)
         self._access_token = data["access_token"]
         expires_in = data.get("expires_in", 3600)
-        self._token_expires = datetime.utcnow() + timedelta(seconds=expires_in)
+        # Refresh a minute early so in-flight calls never carry an expired token
+        self._token_expires = time.monotonic() + expires_in - 60
 
         return self._access_token
 
     async def _request(self, endpoint: str, params: dict = None) -> dict:
-        """Make an authenticated request to Spotify API."""
+        """
+        Make an authenticated request to Spotify API.
+
+        Identical requests already in flight are not repeated: concurrent callers
+        (e.g. many CSV rows sharing an album) await the same call.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        pending = _inflight.get(key)
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._send(endpoint, params))
+            _inflight[key] = pending
+            # Only drop our own entry: a call from another loop may have replaced it
+            pending.add_done_callback(lambda fut: _inflight.pop(key, None) if _inflight.get(key) is fut else None)
+        # Shielded so that one caller being cancelled doesn't cancel the shared call
+        return await asyncio.shield(pending)
+
+    async def _throttle(self) -> None:
+        """Wait until another call fits in the SPOTIFY_MAX_RPM budget, then record it."""
+        max_rpm = settings.SPOTIFY_MAX_RPM
+        if max_rpm <= 0:
+            return
+
+        sent = self._sent
+        while True:
+            now = time.monotonic()
+            while sent and sent[0] <= now - 60:
+                sent.popleft()
+            if len(sent) < max_rpm:
+                break
+            await asyncio.sleep(sent[0] + 60 - now)
+        sent.append(now)
+
+    async def _send(self, endpoint: str, params: Optional[dict]) -> dict:
+        """Send one authenticated GET request, handling token expiry and rate limits."""
         token = await self._get_access_token()
 
         def _do_get(t: str) -> requests.Response:
-            return requests.get(
+            return self._session.get(
                 f"{self.BASE_URL}{endpoint}",
                 headers={"Authorization": f"Bearer {t}"},
                 params=params,
@@ -118,19 +468,42 @@ class SpotifyService:
             )
 
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, partial(_do_get, token))
+
+        async def _get(t: str) -> requests.Response:
+            # The slot is held for the HTTP call only, never across a retry wait
+            async with self._limit:
+                await self._throttle()
+                return await loop.run_in_executor(None, partial(_do_get, t))
+
+        response = await _get(token)
 
         if response.status_code == 401:
-            # Token expired, refresh and retry
-            self._access_token = None
+            # Token expired, refresh and retry (unless another call already did)
+            if self._access_token == token:
+                self._access_token = None
             token = await self._get_access_token()
-            response = await loop.run_in_executor(None, partial(_do_get, token))
+            response = await _get(token)
+
+        attempt = 0
+        while response.status_code == 429 and attempt < self.MAX_RETRIES:
+            # Rate limited: slow down, wait as instructed and retry
+            self._limit.backoff()
+            attempt += 1
+            delay = _retry_delay(response, attempt)
+            logger.info(f"Spotify rate limit on {endpoint}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            response = await _get(token)
+
+        if response.status_code == 200:
+            self._limit.success()
+        elif response.status_code == 429 or response.status_code >= 500:
+            self._limit.backoff()
 
         if response.status_code != 200:
             logger.warning(f"Spotify API error: {response.status_code} - {response.text[:200]}")
             return {}
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def search_artist(self, name: str) -> Optional[dict]:
         """
@@ -140,8 +513,8 @@ class SpotifyService:
             Dict with artist info including image URL, or None if not found.
         """
         cache_key = f"artist:{name.lower()}"
-        cached = _get_cached(cache_key)
-        if cached is not None:
+        cached = await _get_cached(cache_key)
+        if cached is not _MISS:
             return cached
 
         result = await self._request("/search", {
@@ -152,21 +525,21 @@ class SpotifyService:
 
         artists = result.get("artists", {}).get("items", [])
         if not artists:
-            _set_cached(cache_key, None)
+            await _set_not_found(cache_key, result, "artists")
             return None
 
-        artist = artists[0]
-        images = artist.get("images", [])
+        get = artists[0].get
+        image_url, image_url_small = _image_urls(get("images"))
 
         data = {
-            "spotify_id": artist.get("id"),
-            "name": artist.get("name"),
-            "image_url": images[0]["url"] if images else None,
-            "image_url_small": images[-1]["url"] if images else None,
-            "popularity": artist.get("popularity"),
-            "genres": artist.get("genres", []),
+            "spotify_id": get("id"),
+            "name": get("name"),
+            "image_url": image_url,
+            "image_url_small": image_url_small,
+            "popularity": get("popularity"),
+            "genres": get("genres", []),
         }
-        _set_cached(cache_key, data)
+        await _set_cached(cache_key, data)
         return data
 
     async def search_album_by_upc(self, upc: str) -> Optional[dict]:
@@ -177,8 +550,8 @@ class SpotifyService:
             Dict with album info including artwork URL, or None if not found.
         """
         cache_key = f"album:upc:{upc}"
-        cached = _get_cached(cache_key)
-        if cached is not None:
+        cached = await _get_cached(cache_key)
+        if cached is not _MISS:
             return cached
 
         result = await self._request("/search", {
@@ -189,22 +562,22 @@ class SpotifyService:
 
         albums = result.get("albums", {}).get("items", [])
         if not albums:
-            _set_cached(cache_key, None)
+            await _set_not_found(cache_key, result, "albums")
             return None
 
-        album = albums[0]
-        images = album.get("images", [])
+        get = albums[0].get
+        image_url, image_url_small = _image_urls(get("images"))
 
         data = {
-            "spotify_id": album.get("id"),
-            "name": album.get("name"),
-            "image_url": images[0]["url"] if images else None,
-            "image_url_small": images[-1]["url"] if images else None,
-            "release_date": album.get("release_date"),
-            "total_tracks": album.get("total_tracks"),
-            "artists": [a.get("name") for a in album.get("artists", [])],
+            "spotify_id": get("id"),
+            "name": get("name"),
+            "image_url": image_url,
+            "image_url_small": image_url_small,
+            "release_date": get("release_date"),
+            "total_tracks": get("total_tracks"),
+            "artists": [a.get("name") for a in get("artists", [])],
         }
-        _set_cached(cache_key, data)
+        await _set_cached(cache_key, data)
         return data
 
     async def search_track_by_isrc(self, isrc: str) -> Optional[dict]:
@@ -215,10 +588,25 @@ class SpotifyService:
             Dict with track and album info including artwork URL, or None if not found.
         """
         cache_key = f"track:isrc:{isrc}"
-        cached = _get_cached(cache_key)
-        if cached is not None:
+        cached = await _get_cached(cache_key)
+        if cached is not _MISS:
             return cached
 
+        data = await self._search_track(isrc)
+        if data is None:
+            return None
+
+        await self._add_album_details([data])
+        await _set_cached(cache_key, data)
+        return data
+
+    async def _search_track(self, isrc: str) -> Optional[dict]:
+        """
+        Search for a track by ISRC, leaving album_release_date and album_upc unset.
+
+        "Not found" is cached here; found tracks are cached by the caller once
+        their album details are filled in.
+        """
         result = await self._request("/search", {
             "q": f"isrc:{isrc}",
             "type": "track",
@@ -227,42 +615,137 @@ class SpotifyService:
 
         tracks = result.get("tracks", {}).get("items", [])
         if not tracks:
-            _set_cached(cache_key, None)
+            await _set_not_found(f"track:isrc:{isrc}", result, "tracks")
             return None
 
-        track = tracks[0]
-        album = track.get("album", {})
-        images = album.get("images", [])
-        album_id = album.get("id")
+        get = tracks[0].get
+        album = get("album", {})
+        image_url, image_url_small = _image_urls(album.get("images"))
+
+        return {
+            "spotify_id": get("id"),
+            "name": get("name"),
+            "album_name": album.get("name"),
+            "album_id": album.get("id"),
+            "album_release_date": None,
+            "album_upc": None,
+            "image_url": image_url,
+            "image_url_small": image_url_small,
+            "artists": [a.get("name") for a in get("artists", [])],
+            "duration_ms": get("duration_ms"),
+            "popularity": get("popularity"),
+        }
 
-        # Fetch full album details to get release_date and UPC
-        album_release_date = None
-        album_upc = None
-        if album_id:
+    async def _add_album_details(self, tracks: list[dict]) -> None:
+        """
+        Fill in album_release_date and album_upc, which search results lack.
+
+        Each distinct album is fetched once, 20 per /albums request (the API maximum).
+        Albums that can't be fetched leave the fields as None.
+        """
+        album_ids = list(dict.fromkeys(t["album_id"] for t in tracks if t["album_id"]))
+
+        async def _batch(ids: list[str]) -> list:
             try:
-                album_details = await self._request(f"/albums/{album_id}")
-                if album_details:
-                    album_release_date = album_details.get("release_date")
-                    external_ids = album_details.get("external_ids", {})
-                    album_upc = external_ids.get("upc")
+                result = await self._request("/albums", {"ids": ",".join(ids)})
             except Exception:
-                pass  # Ignore errors, we'll just have null values
+                return []  # Ignore errors, we'll just have null values
+            return result.get("albums", [])
+
+        details = {}
+        batches = await asyncio.gather(*(_batch(album_ids[i:i+20]) for i in range(0, len(album_ids), 20)))
+        for albums in batches:
+            for album in albums:
+                if album:
+                    details[album.get("id")] = (album.get("release_date"), album.get("external_ids", {}).get("upc"))
+
+        for track in tracks:
+            found = details.get(track["album_id"])
+            if found:
+                track["album_release_date"], track["album_upc"] = found
+
+    async def _gather_bounded(self, search, keys: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        Run a single-key search for each distinct key, at most MAX_CONCURRENCY at a time.
 
-        data = {
-            "spotify_id": track.get("id"),
-            "name": track.get("name"),
-            "album_name": album.get("name"),
-            "album_id": album_id,
-            "album_release_date": album_release_date,
-            "album_upc": album_upc,
-            "image_url": images[0]["url"] if images else None,
-            "image_url_small": images[-1]["url"] if images else None,
-            "artists": [a.get("name") for a in track.get("artists", [])],
-            "duration_ms": track.get("duration_ms"),
-            "popularity": track.get("popularity"),
-        }
-        _set_cached(cache_key, data)
-        return data
+        Lookups that fail are logged and mapped to None.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def _one(key: str) -> tuple[str, Optional[dict]]:
+            async with semaphore:
+                try:
+                    return key, await search(key)
+                except Exception as e:
+                    logger.warning(f"Spotify lookup failed for {key}: {e}")
+                    return key, None
+
+        results = await asyncio.gather(*(_one(key) for key in dict.fromkeys(keys)))
+        return dict(results)
+
+    async def search_albums_by_upcs(self, upcs: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        Search albums for many UPCs concurrently.
+
+        Returns:
+            Dict mapping each UPC to its search_album_by_upc result (None if not found).
+        """
+        return await self._gather_bounded(self.search_album_by_upc, upcs)
+
+    async def search_tracks_by_isrcs(self, isrcs: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        Search tracks for many ISRCs concurrently.
+
+        Album details are then fetched for all found tracks together, each distinct
+        album once, instead of one album request per track.
+
+        Returns:
+            Dict mapping each ISRC to its search_track_by_isrc result (None if not found).
+        """
+        results: Dict[str, Optional[dict]] = {}
+        to_search = []
+        for isrc in dict.fromkeys(isrcs):
+            cached = await _get_cached(f"track:isrc:{isrc}")
+            if cached is _MISS:
+                to_search.append(isrc)
+                cached = None
+            results[isrc] = cached
+
+        found = await self._gather_bounded(self._search_track, to_search)
+        await self._add_album_details([data for data in found.values() if data is not None])
+        for isrc, data in found.items():
+            if data is not None:
+                await _set_cached(f"track:isrc:{isrc}", data)
+            results[isrc] = data
+        return results
+
+    async def _iter_pages(self, endpoint: str, params: dict, first: dict, limit: int = 50) -> AsyncIterator[dict]:
+        """
+        Yield all items of a paginated listing, given its first page.
+
+        The first page's total tells which offsets remain; those pages are requested
+        concurrently (at most PAGE_CONCURRENCY at a time) and yielded in order as
+        they arrive, so callers can start before the last page is in.
+        """
+        items = first.get("items", [])
+        semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+
+        async def _page(offset: int) -> dict:
+            async with semaphore:
+                return await self._request(endpoint, {**params, "limit": limit, "offset": offset})
+
+        offsets = range(len(items), first.get("total", 0), limit) if items else ()
+        pages = [asyncio.ensure_future(_page(offset)) for offset in offsets]
+        try:
+            for item in items:
+                yield item
+            for page in pages:
+                for item in (await page).get("items", []):
+                    yield item
+        finally:
+            # The caller may stop early: don't leave page requests running
+            for page in pages:
+                page.cancel()
 
     async def get_artist(self, spotify_id: str) -> Optional[dict]:
         """Get artist info by Spotify ID."""
@@ -270,14 +753,15 @@ class SpotifyService:
         if not result:
             return None
 
-        images = result.get("images", [])
+        get = result.get
+        image_url, image_url_small = _image_urls(get("images"))
         return {
-            "spotify_id": result.get("id"),
-            "name": result.get("name"),
-            "image_url": images[0]["url"] if images else None,
-            "image_url_small": images[-1]["url"] if images else None,
-            "popularity": result.get("popularity"),
-            "genres": result.get("genres", []),
+            "spotify_id": get("id"),
+            "name": get("name"),
+            "image_url": image_url,
+            "image_url_small": image_url_small,
+            "popularity": get("popularity"),
+            "genres": get("genres", []),
         }
 
     async def get_album(self, spotify_id: str) -> Optional[dict]:
@@ -286,15 +770,16 @@ class SpotifyService:
         if not result:
             return None
 
-        images = result.get("images", [])
+        get = result.get
+        image_url, image_url_small = _image_urls(get("images"))
         return {
-            "spotify_id": result.get("id"),
-            "name": result.get("name"),
-            "image_url": images[0]["url"] if images else None,
-            "image_url_small": images[-1]["url"] if images else None,
-            "release_date": result.get("release_date"),
-            "total_tracks": result.get("total_tracks"),
-            "artists": [a.get("name") for a in result.get("artists", [])],
+            "spotify_id": get("id"),
+            "name": get("name"),
+            "image_url": image_url,
+            "image_url_small": image_url_small,
+            "release_date": get("release_date"),
+            "total_tracks": get("total_tracks"),
+            "artists": [a.get("name") for a in get("artists", [])],
         }
 
     async def get_album_tracks(self, album_id: str) -> list[dict]:
@@ -305,8 +790,8 @@ class SpotifyService:
             List of track dicts with duration, ISRC, etc.
         """
         cache_key = f"album_tracks:{album_id}"
-        cached = _get_cached(cache_key)
-        if cached is not None:
+        cached = await _get_cached(cache_key)
+        if cached is not _MISS:
             return cached
 
         # First get the album to get release date and genre
@@ -315,49 +800,41 @@ class SpotifyService:
         album_genres = album_result.get("genres", [])
         album_label = album_result.get("label", "")
 
-        all_tracks = []
-        offset = 0
-        limit = 50
+        endpoint = f"/albums/{album_id}/tracks"
+        # The album object already embeds the first page of its tracks
+        first = album_result.get("tracks") or await self._request(endpoint, {"limit": 50, "offset": 0})
 
-        while True:
-            result = await self._request(f"/albums/{album_id}/tracks", {
-                "limit": limit,
-                "offset": offset,
+        all_tracks = []
+        async for track in self._iter_pages(endpoint, {}, first):
+            get = track.get
+            all_tracks.append({
+                "spotify_id": get("id"),
+                "name": get("name"),
+                "track_number": get("track_number"),
+                "disc_number": get("disc_number"),
+                "duration_ms": get("duration_ms"),
+                "explicit": get("explicit"),
+                "artists": [a.get("name") for a in get("artists", [])],
+                "isrc": get("external_ids", {}).get("isrc"),  # May not be available in simplified track
             })
 
-            items = result.get("items", [])
-            if not items:
-                break
-
-            for track in items:
-                all_tracks.append({
-                    "spotify_id": track.get("id"),
-                    "name": track.get("name"),
-                    "track_number": track.get("track_number"),
-                    "disc_number": track.get("disc_number"),
-                    "duration_ms": track.get("duration_ms"),
-                    "explicit": track.get("explicit"),
-                    "artists": [a.get("name") for a in track.get("artists", [])],
-                    "isrc": track.get("external_ids", {}).get("isrc"),  # May not be available in simplified track
-                })
-
-            if len(items) < limit:
-                break
-            offset += limit
-
         # Get full track details for ISRCs (simplified tracks don't have external_ids)
-        track_ids = [t["spotify_id"] for t in all_tracks if t["spotify_id"]]
+        tracks_by_id: Dict[str, dict] = {}
+        for t in all_tracks:
+            if t["spotify_id"]:
+                tracks_by_id.setdefault(t["spotify_id"], t)
+        track_ids = list(tracks_by_id)
         if track_ids:
-            # Spotify allows max 50 tracks per request
-            for i in range(0, len(track_ids), 50):
-                batch = track_ids[i:i+50]
-                tracks_result = await self._request("/tracks", {"ids": ",".join(batch)})
+            # Spotify allows max 50 tracks per request; batches are fetched concurrently
+            batch_results = await asyncio.gather(*(
+                self._request("/tracks", {"ids": ",".join(track_ids[i:i+50])})
+                for i in range(0, len(track_ids), 50)
+            ))
+            for tracks_result in batch_results:
                 for full_track in tracks_result.get("tracks", []):
-                    if full_track:
-                        for t in all_tracks:
-                            if t["spotify_id"] == full_track.get("id"):
-                                t["isrc"] = full_track.get("external_ids", {}).get("isrc")
-                                break
+                    t = tracks_by_id.get(full_track.get("id")) if full_track else None
+                    if t is not None:
+                        t["isrc"] = full_track.get("external_ids", {}).get("isrc")
 
         result_data = {
             "tracks": all_tracks,
@@ -365,7 +842,7 @@ class SpotifyService:
             "genres": album_genres,
             "label": album_label,
         }
-        _set_cached(cache_key, result_data)
+        await _set_cached(cache_key, result_data)
         return result_data
 
     async def get_artist_albums(self, artist_id: str, include_groups: str = "album,single,compilation") -> list[dict]:
@@ -380,47 +857,44 @@ class SpotifyService:
             List of album dicts with info including artwork URLs
         """
         cache_key = f"artist_albums:{artist_id}:{include_groups}"
-        cached = _get_cached(cache_key)
-        if cached is not None:
+        cached = await _get_cached(cache_key)
+        if cached is not _MISS:
             return cached
 
-        all_albums = []
-        offset = 0
-        limit = 50  # Max allowed by Spotify API
-
-        while True:
-            result = await self._request(f"/artists/{artist_id}/albums", {
-                "include_groups": include_groups,
-                "limit": limit,
-                "offset": offset,
-                "market": "FR",  # Use French market for availability
-            })
+        all_albums = [album async for album in self._iter_artist_albums(artist_id, include_groups)]
+        await _set_cached(cache_key, all_albums)
+        return all_albums
 
-            items = result.get("items", [])
-            if not items:
-                break
+    async def iter_artist_albums(
+        self, artist_id: str, include_groups: str = "album,single,compilation"
+    ) -> AsyncIterator[dict]:
+        """
+        Yield all albums for an artist as the pages arrive.
 
-            for album in items:
-                images = album.get("images", [])
-                all_albums.append({
-                    "spotify_id": album.get("id"),
-                    "name": album.get("name"),
-                    "album_type": album.get("album_type"),
-                    "release_date": album.get("release_date"),
-                    "total_tracks": album.get("total_tracks"),
-                    "image_url": images[0]["url"] if images else None,
-                    "image_url_small": images[-1]["url"] if images else None,
-                    "artists": [a.get("name") for a in album.get("artists", [])],
-                    "external_urls": album.get("external_urls", {}),
-                })
-
-            # Check if there are more albums
-            if len(items) < limit:
-                break
-            offset += limit
+        Same albums as get_artist_albums (served from its cache when present), for
+        callers that process them one by one or stop early. Nothing is cached.
+        """
+        cached = await _get_cached(f"artist_albums:{artist_id}:{include_groups}")
+        if cached is not _MISS:
+            for album in cached:
+                yield album
+            return
+
+        async for album in self._iter_artist_albums(artist_id, include_groups):
+            yield album
+
+    async def _iter_artist_albums(self, artist_id: str, include_groups: str) -> AsyncIterator[dict]:
+        """Stream an artist's albums from Spotify, shaped, without touching the cache."""
+        endpoint = f"/artists/{artist_id}/albums"
+        params = {
+            "include_groups": include_groups,
+            "market": "FR",  # Use French market for availability
+        }
+        limit = 50  # Max allowed by Spotify API
+        first = await self._request(endpoint, {**params, "limit": limit, "offset": 0})
 
-        _set_cached(cache_key, all_albums)
-        return all_albums
+        async for album in self._iter_pages(endpoint, params, first, limit):
+            yield _shape_album(album)
 
 
 # Default service instance